@@ -143,7 +143,8 @@ async def publish_event(
             "resource_type": request.resource_type,
             "resource_id": request.resource_id,
             "severity": request.severity,
-            "metadata": request.metadata,
+            # Copy so the category tag below does not mutate the request
+            "metadata": dict(request.metadata),
             "user_id": request.user_id,
         }
 
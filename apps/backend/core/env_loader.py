@@ -6,12 +6,17 @@ based on the current deployment environment.
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Union
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Repository root (three levels above apps/backend/core), where the .env files live
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+_REQUIRED_ENV_VARS = ("SECRET_KEY", "JWT_SECRET_KEY", "DATABASE_URL", "REDIS_URL")
+
 
 def load_environment_config(environment: Optional[str] = None) -> None:
     """Load environment-specific .env file.
@@ -28,8 +33,7 @@ def load_environment_config(environment: Optional[str] = None) -> None:
     if environment is None:
         environment = os.getenv("ENVIRONMENT", "development")
 
-    # Get the project root directory (3 levels up from this file)
-    project_root = Path(__file__).parent.parent.parent.parent
+    project_root = _PROJECT_ROOT
 
     # Determine which .env file to load
     env_files_to_try = []
@@ -69,40 +73,51 @@ def _load_env_file(env_file_path: Path) -> None:
         env_file_path: Path to the .env file to load
     """
     try:
-        with open(env_file_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-
-                # Parse key=value pairs
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-
-                    # Only set if not already in environment
-                    # (env vars take precedence)
-                    if key not in os.environ:
-                        os.environ[key] = value
-                else:
-                    logger.warning(
-                        f"Invalid line format in {env_file_path}:" f"{line_num}: {line}"
-                    )
+        text = env_file_path.read_text(encoding="utf-8")
+        _parse_env_lines(text.splitlines(), env_file_path)
 
     except Exception as e:
         logger.error(f"Error loading .env file {env_file_path}: {e}")
         raise
 
 
+def _parse_env_lines(lines: Iterable[str], source: Union[str, Path]) -> None:
+    """Apply KEY=value lines to the environment.
+
+    Args:
+        lines: Iterable of raw .env lines (a split file or any text stream)
+        source: Where the lines came from, used in log messages
+    """
+    existing = set(os.environ)
+    new_vars = {}
+
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+
+        # Skip empty lines and comments
+        if not line or line[0] == "#":
+            continue
+
+        # Parse key=value pairs
+        key, sep, value = line.partition("=")
+        if not sep:
+            logger.warning(f"Invalid line format in {source}:" f"{line_num}: {line}")
+            continue
+
+        # Remove matching surrounding quotes if present
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+
+        # Only set if not already in environment (env vars take precedence);
+        # the first occurrence of a key in the file wins
+        key = key.strip()
+        if key not in existing and key not in new_vars:
+            new_vars[key] = value
+
+    os.environ.update(new_vars)
+
+
 def get_environment_info() -> dict:
     """Get current environment information.
 
@@ -126,11 +141,4 @@ def validate_required_env_vars() -> list:
     Returns:
         List of missing required environment variables
     """
-    required_vars = ["SECRET_KEY", "JWT_SECRET_KEY", "DATABASE_URL", "REDIS_URL"]
-
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
-
-    return missing_vars
+    return [var for var in _REQUIRED_ENV_VARS if not os.getenv(var)]
@@ -19,20 +19,21 @@ logger = logging.getLogger(__name__)
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Set test environment
-os.environ["DATABASE_URL"] = "sqlite:///demo.db"
-os.environ["ENVIRONMENT"] = "demo"
-
 from models.audit import AuditLog  # noqa: E402
-
-# Import models after setting environment
 from models.base import Base  # noqa: E402
 from models.client import Client  # noqa: E402
 from models.provider import Provider  # noqa: E402
 
 
+def _configure_env():
+    """Point the application environment at the demo database."""
+    os.environ["DATABASE_URL"] = "sqlite:///demo.db"
+    os.environ["ENVIRONMENT"] = "demo"
+
+
 def create_demo_database():
     """Create and populate a demo database."""
+    _configure_env()
 
     logger.info("🏥 HIPAA-Compliant Mental Health PMS Database Demo")
     logger.info("=" * 55)
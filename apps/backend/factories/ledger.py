@@ -13,6 +13,41 @@ from .client import ClientFactory
 
 fake = Faker()
 
+# Choice tables, built once rather than per generated entry
+TRANSACTION_TYPES = (
+    "charge",
+    "payment",
+    "adjustment",
+    "refund",
+    "write_off",
+    "insurance_payment",
+)
+
+PAYMENT_TRANSACTION_TYPES = frozenset({"payment", "insurance_payment"})
+
+PAYMENT_METHODS = (
+    "cash",
+    "check",
+    "credit_card",
+    "debit_card",
+    "insurance",
+    "bank_transfer",
+    "other",
+)
+
+BILLING_CODES = (
+    "90834",  # Psychotherapy, 45 minutes
+    "90837",  # Psychotherapy, 60 minutes
+    "90791",  # Psychiatric diagnostic evaluation
+    "90834+90836",  # Psychotherapy with add-on
+    "90847",  # Family psychotherapy
+    "90853",  # Group psychotherapy
+    "99213",  # Office visit, established patient
+    "99214",  # Office visit, established patient, complex
+    "96116",  # Neurobehavioral status exam
+    "96118",  # Neuropsychological testing
+)
+
 
 class LedgerEntryFactory(BaseFactory):
     """Factory for generating HIPAA-compliant ledger entries."""
@@ -25,32 +60,13 @@ class LedgerEntryFactory(BaseFactory):
 
     # Transaction details
     transaction_type = factory.LazyFunction(
-        lambda: fake.random_element(
-            [
-                "charge",
-                "payment",
-                "adjustment",
-                "refund",
-                "write_off",
-                "insurance_payment",
-            ]
-        )
+        lambda: fake.random.choice(TRANSACTION_TYPES)
     )
 
     payment_method = factory.LazyAttribute(
         lambda obj: (
-            fake.random_element(
-                [
-                    "cash",
-                    "check",
-                    "credit_card",
-                    "debit_card",
-                    "insurance",
-                    "bank_transfer",
-                    "other",
-                ]
-            )
-            if obj.transaction_type in ["payment", "insurance_payment"]
+            fake.random.choice(PAYMENT_METHODS)
+            if obj.transaction_type in PAYMENT_TRANSACTION_TYPES
             else None
         )
     )
@@ -67,22 +83,7 @@ class LedgerEntryFactory(BaseFactory):
         )
     )
 
-    billing_code = factory.LazyFunction(
-        lambda: fake.random_element(
-            [
-                "90834",  # Psychotherapy, 45 minutes
-                "90837",  # Psychotherapy, 60 minutes
-                "90791",  # Psychiatric diagnostic evaluation
-                "90834+90836",  # Psychotherapy with add-on
-                "90847",  # Family psychotherapy
-                "90853",  # Group psychotherapy
-                "99213",  # Office visit, established patient
-                "99214",  # Office visit, established patient, complex
-                "96116",  # Neurobehavioral status exam
-                "96118",  # Neuropsychological testing
-            ]
-        )
-    )
+    billing_code = factory.LazyFunction(lambda: fake.random.choice(BILLING_CODES))
 
     diagnosis_code = factory.LazyFunction(
         lambda: fake.random_element(
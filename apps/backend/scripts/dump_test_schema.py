@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Pre-render the SQLite test schema so test runs skip DDL compilation."""
+
+import importlib
+import pkgutil
+import sys
+from pathlib import Path
+
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import models  # noqa: E402
+from models.base import Base  # noqa: E402
+
+SCHEMA_FILE = backend_dir / "tests" / "_schema.sql"
+
+
+def render_schema_sql() -> str:
+    """Compile CREATE TABLE/INDEX statements for all models against SQLite.
+
+    Output is deterministic so the checked-in schema only changes when the
+    models do.
+    """
+    # Not every model module is re-exported from models/__init__.py
+    for module in pkgutil.iter_modules(models.__path__):
+        importlib.import_module(f"models.{module.name}")
+
+    dialect = sqlite.dialect()
+    statements: list[str] = []
+
+    def render(ddl) -> None:
+        compiled = str(ddl.compile(dialect=dialect)).strip()
+        statements.append("\n".join(line.rstrip() for line in compiled.splitlines()))
+
+    # Tables in dependency order (ties broken by name), each followed by its
+    # indexes sorted by name, so repeated runs render byte-identical output
+    for table in Base.metadata.sorted_tables:
+        render(CreateTable(table))
+        for index in sorted(table.indexes, key=lambda index: str(index.name)):
+            render(CreateIndex(index))
+
+    return ";\n\n".join(statements) + ";\n"
+
+
+def main() -> int:
+    """Write the rendered schema to tests/_schema.sql."""
+    SCHEMA_FILE.write_text(render_schema_sql(), encoding="utf-8")
+    print(f"Wrote {SCHEMA_FILE.relative_to(backend_dir)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
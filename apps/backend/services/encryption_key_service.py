@@ -1,7 +1,8 @@
 """Encryption key management service for HIPAA-compliant PHI security."""
 
+import copy
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from sqlalchemy import and_, or_, select
@@ -10,6 +11,11 @@ from sqlalchemy.orm import Session
 from models.encryption_key import EncryptionKey, KeyProvider, KeyStatus, KeyType
 
 
+def _utcnow() -> datetime:
+    """Return the current UTC time."""
+    return datetime.now(timezone.utc)
+
+
 class EncryptionKeyService:
     """Service for managing encryption keys with external KMS integration.
 
@@ -21,15 +27,39 @@ class EncryptionKeyService:
     - Key rotation with rollback capabilities
     """
 
-    def __init__(self, db_session: Session, correlation_id: Optional[str] = None):
+    def __init__(
+        self,
+        db_session: Optional[Session],
+        correlation_id: Optional[str] = None,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
         """Initialize the encryption key service.
 
         Args:
-            db_session: Database session for operations
+            db_session: Database session for operations, or None for an
+                unbound service to be bound later with bind()
             correlation_id: Request correlation ID for audit trails
+            clock: Optional callable returning the current UTC time
         """
         self.db = db_session
         self.correlation_id = correlation_id or str(uuid4())
+        self.clock = clock or _utcnow
+
+    def bind(self, db_session: Session) -> "EncryptionKeyService":
+        """Return a copy of this service that operates on the given session.
+
+        The copy shares the correlation ID and clock; this instance is left
+        unchanged, so one unbound service can back many sessions.
+
+        Args:
+            db_session: Database session for operations
+
+        Returns:
+            EncryptionKeyService bound to db_session
+        """
+        bound = copy.copy(self)
+        bound.db = db_session
+        return bound
 
     async def create_key(
         self,
@@ -73,36 +103,21 @@ class EncryptionKeyService:
             ValueError: If key parameters are invalid
             IntegrityError: If key already exists
         """
-        # Validate input parameters
-        if not tenant_id or not key_name or not kms_key_id:
-            raise ValueError("tenant_id, key_name, and kms_key_id are required")
-
-        # Check for existing key with same name and tenant
-        existing_key = self._get_active_key_by_name(tenant_id, key_name)
-        if existing_key:
-            raise ValueError(
-                f"Active key '{key_name}' already exists for tenant " f"{tenant_id}"
-            )
-
-        # Create new encryption key
-        encryption_key = EncryptionKey(
+        encryption_key = self._build_key(
             tenant_id=tenant_id,
             key_name=key_name,
             key_type=key_type,
             kms_provider=kms_provider,
             kms_key_id=kms_key_id,
+            created_by_token_id=created_by_token_id,
             kms_region=kms_region,
             kms_endpoint=kms_endpoint,
-            status=KeyStatus.PENDING,
-            version="1",
             expires_at=expires_at,
             key_algorithm=key_algorithm,
             key_purpose=key_purpose,
-            compliance_tags=compliance_tags or {},
-            authorized_services=authorized_services or [],
-            access_policy=access_policy or {},
-            created_by_token_id=created_by_token_id,
-            correlation_id=self.correlation_id,
+            compliance_tags=compliance_tags,
+            authorized_services=authorized_services,
+            access_policy=access_policy,
         )
 
         self.db.add(encryption_key)
@@ -114,6 +129,36 @@ class EncryptionKeyService:
 
         return encryption_key
 
+    async def bulk_create_keys(self, key_specs: List[Dict]) -> List[EncryptionKey]:
+        """Create several encryption key references in a single commit.
+
+        Args:
+            key_specs: Keyword arguments for each key, as accepted by create_key
+
+        Returns:
+            Created EncryptionKey instances, in the order given
+
+        Raises:
+            ValueError: If any key's parameters are invalid, or two keys in
+                the batch share a KMS key ID
+        """
+        encryption_keys = [self._build_key(**spec) for spec in key_specs]
+
+        # kms_key_id is unique; reject repeats before touching the session
+        # rather than on commit
+        seen_kms_ids = set()
+        for encryption_key in encryption_keys:
+            if encryption_key.kms_key_id in seen_kms_ids:
+                raise ValueError(
+                    f"Duplicate KMS key ID '{encryption_key.kms_key_id}' in batch"
+                )
+            seen_kms_ids.add(encryption_key.kms_key_id)
+
+        self.db.add_all(encryption_keys)
+        self.db.commit()
+
+        return encryption_keys
+
     async def activate_key(
         self, key_id: UUID, activated_by_token_id: Optional[UUID] = None
     ) -> EncryptionKey:
@@ -138,7 +183,7 @@ class EncryptionKeyService:
 
         # Update key status
         encryption_key.status = KeyStatus.ACTIVE
-        encryption_key.activated_at = datetime.now(timezone.utc)
+        encryption_key.activated_at = self.clock()
 
         self.db.commit()
 
@@ -178,9 +223,8 @@ class EncryptionKeyService:
 
         # Create new key version
         new_version = str(int(old_key.version) + 1)
-        rollback_expires = datetime.now(timezone.utc) + timedelta(
-            hours=rollback_period_hours
-        )
+        now = self.clock()
+        rollback_expires = now + timedelta(hours=rollback_period_hours)
 
         new_key = EncryptionKey(
             tenant_id=old_key.tenant_id,
@@ -192,7 +236,7 @@ class EncryptionKeyService:
             kms_endpoint=old_key.kms_endpoint,
             status=KeyStatus.ACTIVE,
             version=new_version,
-            activated_at=datetime.now(timezone.utc),
+            activated_at=now,
             expires_at=old_key.expires_at,
             parent_key_id=old_key.id,
             can_rollback=True,
@@ -208,7 +252,7 @@ class EncryptionKeyService:
 
         # Update old key status
         old_key.status = KeyStatus.ROTATED
-        old_key.rotated_at = datetime.now(timezone.utc)
+        old_key.rotated_at = now
         old_key.can_rollback = True
         old_key.rollback_expires_at = rollback_expires
 
@@ -242,7 +286,7 @@ class EncryptionKeyService:
         if not new_key.can_rollback:
             raise ValueError(f"Key {new_key_id} cannot be rolled back")
 
-        now = datetime.now(timezone.utc)
+        now = self.clock()
         if new_key.rollback_expires_at:
             rollback_expires_at = new_key.rollback_expires_at
             if rollback_expires_at.tzinfo is None:
@@ -302,7 +346,7 @@ class EncryptionKeyService:
 
         # Update last used timestamp
         if encryption_key:
-            encryption_key.last_used_at = datetime.now(timezone.utc)
+            encryption_key.last_used_at = self.clock()
             self.db.commit()
 
         return encryption_key
@@ -334,7 +378,7 @@ class EncryptionKeyService:
             query = query.where(EncryptionKey.status == status)
 
         if not include_expired:
-            now = datetime.now(timezone.utc)
+            now = self.clock()
             query = query.where(
                 or_(EncryptionKey.expires_at.is_(None), EncryptionKey.expires_at > now)
             )
@@ -361,7 +405,7 @@ class EncryptionKeyService:
             raise ValueError(f"Key {key_id} not found")
 
         encryption_key.status = KeyStatus.EXPIRED
-        encryption_key.expires_at = datetime.now(timezone.utc)
+        encryption_key.expires_at = self.clock()
 
         self.db.commit()
 
@@ -381,7 +425,7 @@ class EncryptionKeyService:
         Returns:
             Number of keys cleaned up
         """
-        now = datetime.now(timezone.utc)
+        now = self.clock()
         cleanup_cutoff = cleanup_before or (now - timedelta(days=30))
 
         # Build cleanup query
@@ -438,6 +482,58 @@ class EncryptionKeyService:
 
     # Private helper methods
 
+    def _build_key(
+        self,
+        tenant_id: str,
+        key_name: str,
+        key_type: KeyType,
+        kms_provider: KeyProvider,
+        kms_key_id: str,
+        created_by_token_id: Optional[UUID] = None,
+        kms_region: Optional[str] = None,
+        kms_endpoint: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+        key_algorithm: str = "AES-256-GCM",
+        key_purpose: Optional[str] = None,
+        compliance_tags: Optional[Dict] = None,
+        authorized_services: Optional[List[str]] = None,
+        access_policy: Optional[Dict] = None,
+    ) -> EncryptionKey:
+        """Validate parameters and build a pending key without persisting it."""
+        # Validate input parameters
+        if not tenant_id or not key_name or not kms_key_id:
+            raise ValueError("tenant_id, key_name, and kms_key_id are required")
+
+        # Check for existing key with same name and tenant
+        existing_key = self._get_active_key_by_name(tenant_id, key_name)
+        if existing_key:
+            raise ValueError(
+                f"Active key '{key_name}' already exists for tenant " f"{tenant_id}"
+            )
+
+        # Create new encryption key
+        encryption_key = EncryptionKey(
+            tenant_id=tenant_id,
+            key_name=key_name,
+            key_type=key_type,
+            kms_provider=kms_provider,
+            kms_key_id=kms_key_id,
+            kms_region=kms_region,
+            kms_endpoint=kms_endpoint,
+            status=KeyStatus.PENDING,
+            version="1",
+            expires_at=expires_at,
+            key_algorithm=key_algorithm,
+            key_purpose=key_purpose,
+            compliance_tags=compliance_tags or {},
+            authorized_services=authorized_services or [],
+            access_policy=access_policy or {},
+            created_by_token_id=created_by_token_id,
+            correlation_id=self.correlation_id,
+        )
+
+        return encryption_key
+
     def _get_key_by_id(self, key_id: UUID) -> Optional[EncryptionKey]:
         """Get encryption key by ID."""
         query = select(EncryptionKey).where(EncryptionKey.id == key_id)
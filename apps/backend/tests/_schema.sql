@@ -0,0 +1,800 @@
+CREATE TABLE access_review_checklists (
+	id INTEGER NOT NULL,
+	review_id INTEGER NOT NULL,
+	user_id VARCHAR(255) NOT NULL,
+	item_type VARCHAR(50) NOT NULL,
+	description TEXT NOT NULL,
+	status VARCHAR(20) NOT NULL,
+	reviewer_notes TEXT,
+	completed_by VARCHAR(255),
+	completed_at DATETIME,
+	created_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL,
+	PRIMARY KEY (id)
+);
+
+CREATE INDEX ix_access_review_checklists_id ON access_review_checklists (id);
+
+CREATE INDEX ix_access_review_checklists_review_id ON access_review_checklists (review_id);
+
+CREATE INDEX ix_access_review_checklists_user_id ON access_review_checklists (user_id);
+
+CREATE TABLE access_review_logs (
+	id INTEGER NOT NULL,
+	user_id VARCHAR(255) NOT NULL,
+	action VARCHAR(100) NOT NULL,
+	resource VARCHAR(255),
+	method VARCHAR(10),
+	ip_address VARCHAR(45),
+	user_agent TEXT,
+	success BOOLEAN NOT NULL,
+	error_message TEXT,
+	meta_data JSON,
+	created_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL,
+	PRIMARY KEY (id)
+);
+
+CREATE INDEX ix_access_review_logs_id ON access_review_logs (id);
+
+CREATE INDEX ix_access_review_logs_user_id ON access_review_logs (user_id);
+
+CREATE TABLE audit_log (
+	correlation_id VARCHAR(255) NOT NULL,
+	user_id VARCHAR(36),
+	action VARCHAR(100) NOT NULL,
+	resource_type VARCHAR(100) NOT NULL,
+	resource_id VARCHAR(36),
+	old_values JSON,
+	new_values JSON,
+	ip_address VARCHAR(45),
+	user_agent TEXT,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id)
+);
+
+CREATE INDEX idx_audit_action ON audit_log (action);
+
+CREATE INDEX idx_audit_correlation_id ON audit_log (correlation_id);
+
+CREATE INDEX idx_audit_created_at ON audit_log (created_at);
+
+CREATE INDEX idx_audit_resource ON audit_log (resource_type, resource_id);
+
+CREATE INDEX idx_audit_user_date ON audit_log (user_id, created_at);
+
+CREATE INDEX idx_audit_user_id ON audit_log (user_id);
+
+CREATE INDEX ix_audit_log_correlation_id ON audit_log (correlation_id);
+
+CREATE INDEX ix_audit_log_tenant_id ON audit_log (tenant_id);
+
+CREATE INDEX ix_audit_log_user_id ON audit_log (user_id);
+
+CREATE TABLE clients (
+	first_name VARCHAR(100) NOT NULL,
+	last_name VARCHAR(100) NOT NULL,
+	middle_name VARCHAR(100),
+	email VARCHAR(255),
+	phone VARCHAR(20),
+	address_line1 VARCHAR(255),
+	address_line2 VARCHAR(255),
+	city VARCHAR(100),
+	state VARCHAR(50),
+	zip_code VARCHAR(10),
+	date_of_birth DATE,
+	gender VARCHAR(20),
+	insurance_provider VARCHAR(255),
+	insurance_id VARCHAR(100),
+	emergency_contact_name VARCHAR(200),
+	emergency_contact_phone VARCHAR(20),
+	emergency_contact_relationship VARCHAR(100),
+	primary_diagnosis TEXT,
+	secondary_diagnoses TEXT,
+	medications TEXT,
+	allergies TEXT,
+	is_active BOOLEAN NOT NULL,
+	preferred_language VARCHAR(50) NOT NULL,
+	communication_preferences TEXT,
+	intake_notes TEXT,
+	administrative_notes TEXT,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id)
+);
+
+CREATE INDEX idx_client_active ON clients (is_active);
+
+CREATE INDEX idx_client_dob ON clients (date_of_birth);
+
+CREATE INDEX idx_client_email ON clients (email);
+
+CREATE INDEX idx_client_name ON clients (last_name, first_name);
+
+CREATE INDEX idx_client_phone ON clients (phone);
+
+CREATE INDEX ix_clients_correlation_id ON clients (correlation_id);
+
+CREATE INDEX ix_clients_email ON clients (email);
+
+CREATE INDEX ix_clients_tenant_id ON clients (tenant_id);
+
+CREATE TABLE data_retention_policies (
+	policy_name VARCHAR(255) NOT NULL,
+	description TEXT,
+	data_type VARCHAR(15) NOT NULL,
+	retention_period INTEGER NOT NULL,
+	retention_unit VARCHAR(6) NOT NULL,
+	status VARCHAR(8) NOT NULL,
+	last_executed_at DATETIME,
+	next_execution_at DATETIME,
+	legal_hold_exempt BOOLEAN NOT NULL,
+	compliance_notes TEXT,
+	batch_size INTEGER NOT NULL,
+	dry_run_only BOOLEAN NOT NULL,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id)
+);
+
+CREATE INDEX idx_retention_policy_data_type_status ON data_retention_policies (data_type, status);
+
+CREATE INDEX idx_retention_policy_next_execution ON data_retention_policies (next_execution_at);
+
+CREATE INDEX idx_retention_policy_tenant_active ON data_retention_policies (tenant_id, status);
+
+CREATE INDEX ix_data_retention_policies_correlation_id ON data_retention_policies (correlation_id);
+
+CREATE INDEX ix_data_retention_policies_tenant_id ON data_retention_policies (tenant_id);
+
+CREATE TABLE fhir_mappings (
+	internal_id VARCHAR(36) NOT NULL,
+	fhir_resource_type VARCHAR(20) NOT NULL,
+	fhir_resource_id VARCHAR(255) NOT NULL,
+	fhir_server_url VARCHAR(500),
+	status VARCHAR(10) NOT NULL,
+	version VARCHAR(50),
+	last_sync_at DATETIME,
+	last_error TEXT,
+	last_error_at DATETIME,
+	error_count VARCHAR(10) NOT NULL,
+	is_active BOOLEAN NOT NULL,
+	created_by VARCHAR(255),
+	updated_by VARCHAR(255),
+	notes TEXT,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id),
+	CONSTRAINT uq_fhir_mapping_internal_resource_tenant UNIQUE (internal_id, fhir_resource_type, tenant_id),
+	CONSTRAINT uq_fhir_mapping_fhir_resource_tenant UNIQUE (fhir_resource_id, fhir_resource_type, fhir_server_url, tenant_id)
+);
+
+CREATE INDEX idx_fhir_mapping_active ON fhir_mappings (is_active);
+
+CREATE INDEX idx_fhir_mapping_error_count ON fhir_mappings (error_count);
+
+CREATE INDEX idx_fhir_mapping_error_tracking ON fhir_mappings (status, error_count, last_error_at);
+
+CREATE INDEX idx_fhir_mapping_fhir_id ON fhir_mappings (fhir_resource_id);
+
+CREATE INDEX idx_fhir_mapping_internal_id ON fhir_mappings (internal_id);
+
+CREATE INDEX idx_fhir_mapping_last_sync ON fhir_mappings (last_sync_at);
+
+CREATE INDEX idx_fhir_mapping_lookup ON fhir_mappings (internal_id, fhir_resource_type, tenant_id);
+
+CREATE INDEX idx_fhir_mapping_resource_type ON fhir_mappings (fhir_resource_type);
+
+CREATE INDEX idx_fhir_mapping_reverse_lookup ON fhir_mappings (fhir_resource_id, fhir_resource_type, tenant_id);
+
+CREATE INDEX idx_fhir_mapping_status ON fhir_mappings (status);
+
+CREATE INDEX idx_fhir_mapping_sync_status ON fhir_mappings (status, last_sync_at, tenant_id);
+
+CREATE INDEX idx_fhir_mapping_tenant ON fhir_mappings (tenant_id);
+
+CREATE INDEX idx_fhir_mappings_error_status_count ON fhir_mappings (error_count, status);
+
+CREATE INDEX idx_fhir_mappings_server_resource_type ON fhir_mappings (fhir_server_url, fhir_resource_type);
+
+CREATE INDEX ix_fhir_mappings_correlation_id ON fhir_mappings (correlation_id);
+
+CREATE INDEX ix_fhir_mappings_fhir_resource_id ON fhir_mappings (fhir_resource_id);
+
+CREATE INDEX ix_fhir_mappings_fhir_resource_type ON fhir_mappings (fhir_resource_type);
+
+CREATE INDEX ix_fhir_mappings_internal_id ON fhir_mappings (internal_id);
+
+CREATE INDEX ix_fhir_mappings_is_active ON fhir_mappings (is_active);
+
+CREATE INDEX ix_fhir_mappings_status ON fhir_mappings (status);
+
+CREATE INDEX ix_fhir_mappings_tenant_id ON fhir_mappings (tenant_id);
+
+CREATE TABLE legal_holds (
+	hold_name VARCHAR(255) NOT NULL,
+	description TEXT,
+	reason VARCHAR(18) NOT NULL,
+	status VARCHAR(8) NOT NULL,
+	resource_type VARCHAR(100) NOT NULL,
+	resource_id VARCHAR(255),
+	filter_criteria TEXT,
+	hold_start_date DATETIME NOT NULL,
+	hold_end_date DATETIME,
+	released_at DATETIME,
+	case_number VARCHAR(255),
+	legal_contact VARCHAR(255),
+	compliance_notes TEXT,
+	auto_release BOOLEAN NOT NULL,
+	notification_sent BOOLEAN NOT NULL,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id)
+);
+
+CREATE INDEX idx_legal_hold_end_date ON legal_holds (hold_end_date);
+
+CREATE INDEX idx_legal_hold_resource_id ON legal_holds (resource_type, resource_id);
+
+CREATE INDEX idx_legal_hold_resource_status ON legal_holds (resource_type, status);
+
+CREATE INDEX idx_legal_hold_tenant_active ON legal_holds (tenant_id, status);
+
+CREATE INDEX ix_legal_holds_correlation_id ON legal_holds (correlation_id);
+
+CREATE INDEX ix_legal_holds_tenant_id ON legal_holds (tenant_id);
+
+CREATE TABLE practice_profiles (
+	name VARCHAR(255) NOT NULL,
+	legal_name VARCHAR(255),
+	tax_id VARCHAR(20),
+	npi_number VARCHAR(20),
+	email VARCHAR(255),
+	phone VARCHAR(20),
+	fax VARCHAR(20),
+	website VARCHAR(255),
+	address_line1 VARCHAR(255),
+	address_line2 VARCHAR(255),
+	city VARCHAR(100),
+	state VARCHAR(50),
+	zip_code VARCHAR(10),
+	country VARCHAR(100) NOT NULL,
+	timezone VARCHAR(50) NOT NULL,
+	default_appointment_duration VARCHAR(10) NOT NULL,
+	accepts_new_patients BOOLEAN NOT NULL,
+	is_active BOOLEAN NOT NULL,
+	billing_provider_name VARCHAR(255),
+	billing_contact_email VARCHAR(255),
+	billing_contact_phone VARCHAR(20),
+	description TEXT,
+	administrative_notes TEXT,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id),
+	UNIQUE (npi_number)
+);
+
+CREATE INDEX idx_practice_active ON practice_profiles (is_active);
+
+CREATE INDEX idx_practice_email ON practice_profiles (email);
+
+CREATE INDEX idx_practice_name ON practice_profiles (name);
+
+CREATE INDEX idx_practice_npi ON practice_profiles (npi_number);
+
+CREATE INDEX idx_practice_tenant ON practice_profiles (tenant_id);
+
+CREATE INDEX ix_practice_profiles_correlation_id ON practice_profiles (correlation_id);
+
+CREATE INDEX ix_practice_profiles_email ON practice_profiles (email);
+
+CREATE INDEX ix_practice_profiles_tenant_id ON practice_profiles (tenant_id);
+
+CREATE TABLE providers (
+	first_name VARCHAR(100) NOT NULL,
+	last_name VARCHAR(100) NOT NULL,
+	middle_name VARCHAR(100),
+	title VARCHAR(50),
+	credentials VARCHAR(200),
+	specialty VARCHAR(200),
+	license_number VARCHAR(100),
+	license_state VARCHAR(50),
+	email VARCHAR(255) NOT NULL,
+	phone VARCHAR(20),
+	office_phone VARCHAR(20),
+	office_address_line1 VARCHAR(255),
+	office_address_line2 VARCHAR(255),
+	office_city VARCHAR(100),
+	office_state VARCHAR(50),
+	office_zip_code VARCHAR(10),
+	npi_number VARCHAR(20),
+	tax_id VARCHAR(20),
+	default_appointment_duration VARCHAR(10) NOT NULL,
+	accepts_new_patients BOOLEAN NOT NULL,
+	is_active BOOLEAN NOT NULL,
+	bio TEXT,
+	administrative_notes TEXT,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id),
+	UNIQUE (npi_number)
+);
+
+CREATE INDEX idx_provider_active ON providers (is_active);
+
+CREATE INDEX idx_provider_email ON providers (email);
+
+CREATE INDEX idx_provider_license ON providers (license_number);
+
+CREATE INDEX idx_provider_name ON providers (last_name, first_name);
+
+CREATE INDEX idx_provider_npi ON providers (npi_number);
+
+CREATE INDEX idx_provider_specialty ON providers (specialty);
+
+CREATE INDEX ix_providers_correlation_id ON providers (correlation_id);
+
+CREATE UNIQUE INDEX ix_providers_email ON providers (email);
+
+CREATE INDEX ix_providers_tenant_id ON providers (tenant_id);
+
+CREATE TABLE quarterly_access_reviews (
+	id INTEGER NOT NULL,
+	quarter VARCHAR(7) NOT NULL,
+	year INTEGER NOT NULL,
+	quarter_number INTEGER NOT NULL,
+	status VARCHAR(20) NOT NULL,
+	reviewer_id VARCHAR(255),
+	total_users INTEGER NOT NULL,
+	reviewed_users INTEGER NOT NULL,
+	findings JSON,
+	recommendations JSON,
+	completed_at DATETIME,
+	created_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL,
+	updated_at DATETIME NOT NULL,
+	PRIMARY KEY (id)
+);
+
+CREATE INDEX ix_quarterly_access_reviews_id ON quarterly_access_reviews (id);
+
+CREATE TABLE users (
+	email VARCHAR(255) NOT NULL,
+	provider_id VARCHAR(255) NOT NULL,
+	provider_name VARCHAR(100) NOT NULL,
+	first_name VARCHAR(100),
+	last_name VARCHAR(100),
+	display_name VARCHAR(200),
+	avatar_url VARCHAR(500),
+	roles JSON NOT NULL,
+	permissions JSON NOT NULL,
+	is_active BOOLEAN NOT NULL,
+	is_admin BOOLEAN NOT NULL,
+	last_login_at DATETIME,
+	login_count VARCHAR(50) NOT NULL,
+	failed_login_attempts VARCHAR(50) NOT NULL,
+	locked_until DATETIME,
+	mfa_enabled BOOLEAN NOT NULL,
+	mfa_secret VARCHAR(255),
+	backup_codes JSON NOT NULL,
+	oidc_refresh_token_hash VARCHAR(255),
+	oidc_token_expires_at DATETIME,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id)
+);
+
+CREATE INDEX idx_users_active_roles ON users (is_active, roles);
+
+CREATE INDEX idx_users_email_active ON users (email, is_active);
+
+CREATE INDEX idx_users_last_login ON users (last_login_at);
+
+CREATE INDEX idx_users_provider ON users (provider_name, provider_id);
+
+CREATE INDEX ix_users_correlation_id ON users (correlation_id);
+
+CREATE UNIQUE INDEX ix_users_email ON users (email);
+
+CREATE INDEX ix_users_is_active ON users (is_active);
+
+CREATE INDEX ix_users_provider_id ON users (provider_id);
+
+CREATE INDEX ix_users_tenant_id ON users (tenant_id);
+
+CREATE TABLE appointments (
+	client_id VARCHAR(36) NOT NULL,
+	provider_id VARCHAR(36) NOT NULL,
+	scheduled_start DATETIME NOT NULL,
+	scheduled_end DATETIME NOT NULL,
+	actual_start DATETIME,
+	actual_end DATETIME,
+	appointment_type VARCHAR(21) NOT NULL,
+	status VARCHAR(11) NOT NULL,
+	duration_minutes INTEGER NOT NULL,
+	billable_units INTEGER NOT NULL,
+	location VARCHAR(255),
+	is_telehealth BOOLEAN NOT NULL,
+	meeting_link VARCHAR(500),
+	reason_for_visit TEXT,
+	appointment_notes TEXT,
+	cancellation_reason TEXT,
+	reminder_sent BOOLEAN NOT NULL,
+	reminder_sent_at DATETIME,
+	confirmation_sent BOOLEAN NOT NULL,
+	confirmation_sent_at DATETIME,
+	copay_amount VARCHAR(10),
+	insurance_authorization VARCHAR(100),
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id),
+	FOREIGN KEY(client_id) REFERENCES clients (id) ON DELETE CASCADE,
+	FOREIGN KEY(provider_id) REFERENCES providers (id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_appointment_client ON appointments (client_id);
+
+CREATE INDEX idx_appointment_client_date ON appointments (client_id, scheduled_start);
+
+CREATE INDEX idx_appointment_date_range ON appointments (scheduled_start, scheduled_end);
+
+CREATE INDEX idx_appointment_provider ON appointments (provider_id);
+
+CREATE INDEX idx_appointment_provider_date ON appointments (provider_id, scheduled_start);
+
+CREATE INDEX idx_appointment_scheduled_start ON appointments (scheduled_start);
+
+CREATE INDEX idx_appointment_status ON appointments (status);
+
+CREATE INDEX idx_appointment_type ON appointments (appointment_type);
+
+CREATE INDEX ix_appointments_client_id ON appointments (client_id);
+
+CREATE INDEX ix_appointments_correlation_id ON appointments (correlation_id);
+
+CREATE INDEX ix_appointments_provider_id ON appointments (provider_id);
+
+CREATE INDEX ix_appointments_tenant_id ON appointments (tenant_id);
+
+CREATE TABLE auth_tokens (
+	token_hash VARCHAR(128) NOT NULL,
+	token_type VARCHAR(18) NOT NULL,
+	status VARCHAR(7) NOT NULL,
+	user_id VARCHAR(36),
+	issued_at DATETIME NOT NULL,
+	expires_at DATETIME NOT NULL,
+	last_used_at DATETIME,
+	revoked_at DATETIME,
+	issuer VARCHAR(255) NOT NULL,
+	audience VARCHAR(255) NOT NULL,
+	scopes JSON,
+	client_ip_hash VARCHAR(128),
+	user_agent_hash VARCHAR(128),
+	parent_token_id VARCHAR(36),
+	rotation_count VARCHAR(10) NOT NULL,
+	token_metadata JSON,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id),
+	FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE,
+	FOREIGN KEY(parent_token_id) REFERENCES auth_tokens (id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_auth_tokens_cleanup ON auth_tokens (status, expires_at, created_at);
+
+CREATE INDEX idx_auth_tokens_correlation ON auth_tokens (correlation_id);
+
+CREATE INDEX idx_auth_tokens_hash ON auth_tokens (token_hash);
+
+CREATE INDEX idx_auth_tokens_parent ON auth_tokens (parent_token_id);
+
+CREATE INDEX idx_auth_tokens_status_expires ON auth_tokens (status, expires_at);
+
+CREATE INDEX idx_auth_tokens_user_type ON auth_tokens (user_id, token_type);
+
+CREATE INDEX ix_auth_tokens_correlation_id ON auth_tokens (correlation_id);
+
+CREATE INDEX ix_auth_tokens_expires_at ON auth_tokens (expires_at);
+
+CREATE INDEX ix_auth_tokens_parent_token_id ON auth_tokens (parent_token_id);
+
+CREATE INDEX ix_auth_tokens_status ON auth_tokens (status);
+
+CREATE INDEX ix_auth_tokens_tenant_id ON auth_tokens (tenant_id);
+
+CREATE UNIQUE INDEX ix_auth_tokens_token_hash ON auth_tokens (token_hash);
+
+CREATE INDEX ix_auth_tokens_token_type ON auth_tokens (token_type);
+
+CREATE INDEX ix_auth_tokens_user_id ON auth_tokens (user_id);
+
+CREATE TABLE ledger (
+	client_id VARCHAR(36) NOT NULL,
+	transaction_type VARCHAR(17) NOT NULL,
+	amount NUMERIC(10, 2) NOT NULL,
+	description VARCHAR(500) NOT NULL,
+	service_date DATE,
+	billing_code VARCHAR(20),
+	diagnosis_code VARCHAR(20),
+	payment_method VARCHAR(13),
+	reference_number VARCHAR(100),
+	check_number VARCHAR(50),
+	insurance_claim_number VARCHAR(100),
+	insurance_authorization VARCHAR(100),
+	is_posted BOOLEAN NOT NULL,
+	is_reconciled BOOLEAN NOT NULL,
+	reconciliation_date DATE,
+	notes TEXT,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id),
+	FOREIGN KEY(client_id) REFERENCES clients (id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_ledger_amount ON ledger (amount);
+
+CREATE INDEX idx_ledger_billing_code ON ledger (billing_code);
+
+CREATE INDEX idx_ledger_client ON ledger (client_id);
+
+CREATE INDEX idx_ledger_client_date ON ledger (client_id, service_date);
+
+CREATE INDEX idx_ledger_posted ON ledger (is_posted);
+
+CREATE INDEX idx_ledger_reconciled ON ledger (is_reconciled);
+
+CREATE INDEX idx_ledger_service_date ON ledger (service_date);
+
+CREATE INDEX idx_ledger_transaction_type ON ledger (transaction_type);
+
+CREATE INDEX ix_ledger_client_id ON ledger (client_id);
+
+CREATE INDEX ix_ledger_correlation_id ON ledger (correlation_id);
+
+CREATE INDEX ix_ledger_tenant_id ON ledger (tenant_id);
+
+CREATE TABLE locations (
+	practice_profile_id VARCHAR(36) NOT NULL,
+	name VARCHAR(255) NOT NULL,
+	location_type VARCHAR(50) NOT NULL,
+	phone VARCHAR(20),
+	fax VARCHAR(20),
+	email VARCHAR(255),
+	address_line1 VARCHAR(255) NOT NULL,
+	address_line2 VARCHAR(255),
+	city VARCHAR(100) NOT NULL,
+	state VARCHAR(50) NOT NULL,
+	zip_code VARCHAR(10) NOT NULL,
+	country VARCHAR(100) NOT NULL,
+	timezone VARCHAR(50) NOT NULL,
+	is_primary BOOLEAN NOT NULL,
+	is_active BOOLEAN NOT NULL,
+	accepts_appointments BOOLEAN NOT NULL,
+	wheelchair_accessible BOOLEAN NOT NULL,
+	parking_available BOOLEAN NOT NULL,
+	public_transport_accessible BOOLEAN NOT NULL,
+	operating_hours TEXT,
+	special_instructions TEXT,
+	description TEXT,
+	administrative_notes TEXT,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id),
+	FOREIGN KEY(practice_profile_id) REFERENCES practice_profiles (id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_location_active ON locations (is_active);
+
+CREATE INDEX idx_location_city_state ON locations (city, state);
+
+CREATE INDEX idx_location_name ON locations (name);
+
+CREATE INDEX idx_location_practice ON locations (practice_profile_id);
+
+CREATE INDEX idx_location_primary ON locations (is_primary);
+
+CREATE INDEX idx_location_tenant ON locations (tenant_id);
+
+CREATE INDEX ix_locations_correlation_id ON locations (correlation_id);
+
+CREATE INDEX ix_locations_practice_profile_id ON locations (practice_profile_id);
+
+CREATE INDEX ix_locations_tenant_id ON locations (tenant_id);
+
+CREATE TABLE key_rotation_policies (
+	id VARCHAR(36) NOT NULL,
+	tenant_id VARCHAR(255) NOT NULL,
+	policy_name VARCHAR(255) NOT NULL,
+	description TEXT,
+	key_type VARCHAR(50) NOT NULL,
+	kms_provider VARCHAR(50) NOT NULL,
+	rotation_trigger VARCHAR(50) NOT NULL,
+	status VARCHAR(50) NOT NULL,
+	rotation_interval_days INTEGER,
+	rotation_time_of_day VARCHAR(8),
+	timezone VARCHAR(50),
+	max_usage_count INTEGER,
+	usage_threshold_warning INTEGER,
+	rotation_events JSON,
+	enable_rollback BOOLEAN,
+	rollback_period_hours INTEGER,
+	retain_old_keys_days INTEGER,
+	notification_settings JSON,
+	compliance_tags JSON,
+	authorized_services JSON,
+	created_by_token_id VARCHAR(36) NOT NULL,
+	last_modified_by_token_id VARCHAR(36) NOT NULL,
+	correlation_id VARCHAR(255),
+	last_rotation_at DATETIME,
+	next_rotation_at DATETIME,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	PRIMARY KEY (id),
+	FOREIGN KEY(created_by_token_id) REFERENCES auth_tokens (id),
+	FOREIGN KEY(last_modified_by_token_id) REFERENCES auth_tokens (id)
+);
+
+CREATE INDEX ix_key_rotation_policies_tenant_id ON key_rotation_policies (tenant_id);
+
+CREATE TABLE notes (
+	client_id VARCHAR(36) NOT NULL,
+	provider_id VARCHAR(36) NOT NULL,
+	appointment_id VARCHAR(36),
+	note_type VARCHAR(17) NOT NULL,
+	title VARCHAR(255) NOT NULL,
+	content TEXT NOT NULL,
+	diagnosis_codes TEXT,
+	treatment_goals TEXT,
+	interventions TEXT,
+	client_response TEXT,
+	"plan" TEXT,
+	is_signed BOOLEAN NOT NULL,
+	is_locked BOOLEAN NOT NULL,
+	requires_review BOOLEAN NOT NULL,
+	billable BOOLEAN NOT NULL,
+	billing_code VARCHAR(20),
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id),
+	FOREIGN KEY(client_id) REFERENCES clients (id) ON DELETE CASCADE,
+	FOREIGN KEY(provider_id) REFERENCES providers (id) ON DELETE CASCADE,
+	FOREIGN KEY(appointment_id) REFERENCES appointments (id) ON DELETE SET NULL
+);
+
+CREATE INDEX idx_note_appointment ON notes (appointment_id);
+
+CREATE INDEX idx_note_billable ON notes (billable);
+
+CREATE INDEX idx_note_client ON notes (client_id);
+
+CREATE INDEX idx_note_client_date ON notes (client_id, created_at);
+
+CREATE INDEX idx_note_provider ON notes (provider_id);
+
+CREATE INDEX idx_note_provider_date ON notes (provider_id, created_at);
+
+CREATE INDEX idx_note_signed ON notes (is_signed);
+
+CREATE INDEX idx_note_type ON notes (note_type);
+
+CREATE INDEX ix_notes_appointment_id ON notes (appointment_id);
+
+CREATE INDEX ix_notes_client_id ON notes (client_id);
+
+CREATE INDEX ix_notes_correlation_id ON notes (correlation_id);
+
+CREATE INDEX ix_notes_provider_id ON notes (provider_id);
+
+CREATE INDEX ix_notes_tenant_id ON notes (tenant_id);
+
+CREATE TABLE encryption_keys (
+	key_name VARCHAR(255) NOT NULL,
+	key_type VARCHAR(13) NOT NULL,
+	kms_key_id VARCHAR(512) NOT NULL,
+	kms_provider VARCHAR(15) NOT NULL,
+	kms_region VARCHAR(100),
+	kms_endpoint VARCHAR(512),
+	status VARCHAR(11) NOT NULL,
+	version VARCHAR(50) NOT NULL,
+	activated_at DATETIME,
+	expires_at DATETIME,
+	rotated_at DATETIME,
+	last_used_at DATETIME,
+	parent_key_id VARCHAR(36),
+	can_rollback BOOLEAN NOT NULL,
+	rollback_expires_at DATETIME,
+	key_algorithm VARCHAR(100) NOT NULL,
+	key_purpose TEXT,
+	compliance_tags JSON,
+	authorized_services JSON,
+	access_policy JSON,
+	created_by_token_id VARCHAR(36),
+	rotated_by_token_id VARCHAR(36),
+	rotation_policy_id VARCHAR(36),
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	correlation_id VARCHAR(255),
+	tenant_id VARCHAR(255),
+	PRIMARY KEY (id),
+	FOREIGN KEY(parent_key_id) REFERENCES encryption_keys (id) ON DELETE SET NULL,
+	FOREIGN KEY(created_by_token_id) REFERENCES auth_tokens (id) ON DELETE SET NULL,
+	FOREIGN KEY(rotated_by_token_id) REFERENCES auth_tokens (id) ON DELETE SET NULL,
+	FOREIGN KEY(rotation_policy_id) REFERENCES key_rotation_policies (id) ON DELETE SET NULL
+);
+
+CREATE INDEX idx_encryption_keys_audit ON encryption_keys (created_at, tenant_id, key_type);
+
+CREATE INDEX idx_encryption_keys_kms ON encryption_keys (kms_provider, kms_key_id);
+
+CREATE INDEX idx_encryption_keys_rollback ON encryption_keys (can_rollback, rollback_expires_at);
+
+CREATE INDEX idx_encryption_keys_rotation ON encryption_keys (parent_key_id, rotated_at);
+
+CREATE INDEX idx_encryption_keys_status_expires ON encryption_keys (status, expires_at);
+
+CREATE INDEX idx_encryption_keys_tenant_name ON encryption_keys (tenant_id, key_name, version);
+
+CREATE INDEX idx_encryption_keys_tenant_type ON encryption_keys (tenant_id, key_type, status);
+
+CREATE INDEX idx_encryption_keys_usage ON encryption_keys (last_used_at, status);
+
+CREATE INDEX ix_encryption_keys_correlation_id ON encryption_keys (correlation_id);
+
+CREATE INDEX ix_encryption_keys_created_by_token_id ON encryption_keys (created_by_token_id);
+
+CREATE INDEX ix_encryption_keys_expires_at ON encryption_keys (expires_at);
+
+CREATE INDEX ix_encryption_keys_key_name ON encryption_keys (key_name);
+
+CREATE INDEX ix_encryption_keys_key_type ON encryption_keys (key_type);
+
+CREATE UNIQUE INDEX ix_encryption_keys_kms_key_id ON encryption_keys (kms_key_id);
+
+CREATE INDEX ix_encryption_keys_kms_provider ON encryption_keys (kms_provider);
+
+CREATE INDEX ix_encryption_keys_parent_key_id ON encryption_keys (parent_key_id);
+
+CREATE INDEX ix_encryption_keys_rotation_policy_id ON encryption_keys (rotation_policy_id);
+
+CREATE INDEX ix_encryption_keys_status ON encryption_keys (status);
+
+CREATE INDEX ix_encryption_keys_tenant_id ON encryption_keys (tenant_id);
+
+CREATE INDEX ix_encryption_keys_version ON encryption_keys (version);
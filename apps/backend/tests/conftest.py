@@ -2,16 +2,20 @@
 """Pytest configuration and shared fixtures for database tests."""
 
 import asyncio
+import itertools
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import TypeDecorator, create_engine, event, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # Add the backend directory to the Python path
 backend_dir = Path(__file__).parent.parent
@@ -21,8 +25,12 @@ sys.path.insert(0, str(backend_dir))
 from main import app  # noqa: E402
 from middleware.auth_middleware import AuthenticatedUser  # noqa: E402
 from models.base import Base  # noqa: E402
+from models.provider import Provider  # noqa: E402
 from models.user import User  # noqa: E402
 
+# DDL rendered by scripts/dump_test_schema.py; regenerate when models change
+SCHEMA_FILE = Path(__file__).parent / "_schema.sql"
+
 # Load test environment variables from .env.test file
 test_env_file = Path(__file__).parent.parent.parent.parent / ".env.test"
 if test_env_file.exists():
@@ -41,6 +49,37 @@ else:
     os.environ["JWT_SECRET_KEY"] = "test-jwt-secret-key-for-testing-only"
     os.environ["REDIS_URL"] = "redis://localhost:6379/0"
 
+# Settings read by core.env_loader.get_environment_info/validate_required_env_vars
+_ENV_INFO_VARS = (
+    "ENVIRONMENT",
+    "DEBUG",
+    "LOG_LEVEL",
+    "DATABASE_URL",
+    "REDIS_URL",
+    "SECRET_KEY",
+    "JWT_SECRET_KEY",
+)
+
+
+def pytest_configure(config):
+    """Register the markers used by this suite.
+
+    pytest.ini carries a [tool:pytest] header, so pytest never reads its
+    marker list; register the ones the tests rely on here.
+    """
+    config.addinivalue_line(
+        "markers", "deployment: Pure-Python deployment checks with no I/O"
+    )
+    config.addinivalue_line("markers", "db: Tests that need a database session")
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Unset the environment settings above for one test; restored afterwards."""
+    for var in _ENV_INFO_VARS:
+        monkeypatch.delenv(var, raising=False)
+    return monkeypatch
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -50,41 +89,177 @@ def event_loop():
     loop.close()
 
 
+def _set_sqlite_pragma(dbapi_connection, _connection_record):
+    """Enable foreign keys and in-memory journaling on each new connection."""
+    # pysqlite connections run scripts on their implicit cursor
+    dbapi_connection.executescript(
+        "PRAGMA foreign_keys=ON; "
+        # MEMORY rather than OFF: per-test isolation relies on ROLLBACK
+        "PRAGMA journal_mode=MEMORY; "
+        "PRAGMA synchronous=OFF; "
+        "PRAGMA temp_store=MEMORY; "
+        "PRAGMA cache_size=-65536; "
+        "PRAGMA locking_mode=EXCLUSIVE"
+    )
+    # Let SQLAlchemy own BEGIN so SAVEPOINTs nest correctly under pysqlite
+    dbapi_connection.isolation_level = None
+
+
+def _begin_sqlite_transaction(connection):
+    """Emit BEGIN explicitly since pysqlite's implicit transactions are off."""
+    connection.exec_driver_sql("BEGIN")
+
+
+def _assert_statement_cache_enabled(engine):
+    """Fail loudly if anything would silently disable statement caching."""
+    assert engine.dialect.supports_statement_cache is True
+
+    uncacheable = sorted(
+        {
+            type(column.type).__name__
+            for mapper in Base.registry.mappers
+            for column in mapper.columns
+            if isinstance(column.type, TypeDecorator)
+            and column.type.cache_ok is not True
+        }
+    )
+    assert not uncacheable, f"Set cache_ok = True on: {', '.join(uncacheable)}"
+
+
 @pytest.fixture(scope="session")
 def test_engine():
     """Create a test database engine for the session."""
-    from sqlalchemy.pool import StaticPool
-
+    # StaticPool: one connection for the whole run, so the connect-time
+    # pragmas fire once and the in-memory schema is never lost. Naming the
+    # database after the xdist worker ("master" when not distributed) keeps
+    # each worker's schema private.
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
     engine = create_engine(
-        "sqlite:///:memory:",
+        f"sqlite:///file:memdb_{worker_id}?mode=memory&cache=shared&uri=true",
         poolclass=StaticPool,
         connect_args={
             "check_same_thread": False,
         },
-        echo=False,  # Set to True for SQL debugging
+        # Set PMS_TEST_SQL_ECHO=1 for SQL debugging
+        echo=os.environ.get("PMS_TEST_SQL_ECHO") == "1",
+        # Keep compiled INSERT/SELECT statements across tests
+        query_cache_size=1200,
     )
 
-    # Create all tables
-    Base.metadata.create_all(engine)
+    _assert_statement_cache_enabled(engine)
+
+    # Enable foreign key constraints for SQLite
+    event.listen(engine, "connect", _set_sqlite_pragma)
+    event.listen(engine, "begin", _begin_sqlite_transaction)
+
+    # Create all tables from the pre-rendered DDL when available
+    if SCHEMA_FILE.exists():
+        raw_connection = engine.raw_connection()
+        raw_connection.executescript(SCHEMA_FILE.read_text(encoding="utf-8"))
+        raw_connection.commit()
+        raw_connection.close()
+    else:
+        Base.metadata.create_all(engine)
 
     yield engine
 
     # Cleanup
+    with engine.connect() as connection:
+        connection.execute(text("PRAGMA optimize"))
     Base.metadata.drop_all(engine)
     engine.dispose()
 
 
 @pytest.fixture
 def test_session(test_engine):
-    """Create a test database session for each test."""
-    Session = sessionmaker(bind=test_engine)
+    """Create a test database session for each test.
+
+    The session joins an outer transaction on a dedicated connection and
+    turns its own commits into SAVEPOINT releases, so rolling back the outer
+    transaction discards everything the test wrote.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    Session = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
     session = Session()
 
-    yield session
+    try:
+        yield session
+    finally:
+        # Clean up
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+# Immutable sample payloads shared by every test; copy before mutating
+_CLIENT_DATA = MappingProxyType(
+    {
+        "first_name": "John",
+        "last_name": "Doe",
+        "date_of_birth": datetime(1990, 1, 1).date(),
+        "email": "john.doe@example.com",
+        "phone": "555-0123",
+        "address_line1": "123 Main St",
+        "city": "Anytown",
+        "state": "CA",
+        "zip_code": "12345",
+        "emergency_contact_name": "Jane Doe",
+        "emergency_contact_phone": "555-0124",
+    }
+)
+
+_PROVIDER_DATA = MappingProxyType(
+    {
+        "first_name": "Sarah",
+        "last_name": "Smith",
+        "title": "Dr.",
+        "credentials": "PhD",
+        "email": "dr.smith@clinic.com",
+        "phone": "555-0200",
+        "license_number": "PSY12345",
+        "license_state": "CA",
+        "npi_number": "1234567890",
+        "specialty": "Clinical Psychology",
+        "office_address_line1": "456 Medical Blvd",
+        "office_city": "Anytown",
+        "office_state": "CA",
+        "office_zip_code": "12345",
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def sample_client_data():
+    """Sample client data for testing."""
+    return _CLIENT_DATA
+
+
+@pytest.fixture(scope="session")
+def sample_provider_data():
+    """Sample provider data for testing."""
+    return _PROVIDER_DATA
+
 
-    # Clean up
-    session.rollback()
-    session.close()
+# Shared across tests so every generated provider gets a fresh email/NPI
+_provider_counter = itertools.count(1)
+
+
+@pytest.fixture
+def make_provider(sample_provider_data):
+    """Build Providers whose unique columns never collide between tests."""
+
+    def _make(**overrides):
+        n = next(_provider_counter)
+        data = {
+            **sample_provider_data,
+            "email": f"provider{n}@clinic.com",
+            "npi_number": f"{1234500000 + n}",
+            **overrides,
+        }
+        return Provider(**data)
+
+    return _make
 
 
 @pytest.fixture
@@ -15,9 +15,29 @@ import pytest
 
 from config.qa_seed_config import get_qa_seed_config
 from database import SessionLocal
+from factories import (
+    AppointmentFactory,
+    ClientFactory,
+    LedgerEntryFactory,
+    LocationFactory,
+    NoteFactory,
+    PracticeProfileFactory,
+    ProviderFactory,
+)
 from models import Appointment, Client, Provider
 from scripts.qa_seed_manager import QASeedManager
 
+# Factories the seed manager creates records through
+_SEED_FACTORIES = (
+    AppointmentFactory,
+    ClientFactory,
+    LedgerEntryFactory,
+    LocationFactory,
+    NoteFactory,
+    PracticeProfileFactory,
+    ProviderFactory,
+)
+
 
 @pytest.mark.integration
 class TestQASeedIntegration:
@@ -35,9 +55,15 @@ class TestQASeedIntegration:
             Base.metadata.drop_all(bind=engine)
 
     @pytest.fixture
-    def clean_session(self, test_database):
-        """Provide clean database session for each test."""
+    def clean_session(self, test_database, monkeypatch):
+        """Provide clean database session for each test.
+
+        The seed manager calls its factories directly, so bind them to this
+        session instead of whatever an earlier test module left behind.
+        """
         session = SessionLocal()
+        for factory_cls in _SEED_FACTORIES:
+            monkeypatch.setattr(factory_cls._meta, "sqlalchemy_session", session)
         try:
             yield session
         finally:
@@ -14,26 +14,15 @@ class TestDatabaseServiceAudit:
     @pytest.fixture
     def mock_session(self):
         """Create mock database session."""
-        session = AsyncMock()
-        session.commit = AsyncMock()
-        session.execute = AsyncMock()
-        return session
+        return AsyncMock()
 
     @pytest.fixture
     def db_service(self, mock_session):
         """Create database service with mock session."""
         return DatabaseService(session=mock_session)
 
-    @patch("services.database_service.log_crud_action")
-    @patch("services.database_service.get_correlation_id")
-    @patch("services.database_service.is_enabled")
-    async def test_create_client_audit_logging(
-        self, mock_is_enabled, mock_get_correlation, mock_log_crud, db_service
-    ):
+    def test_create_client_audit_logging(self, db_service):
         """Test that client creation triggers audit logging."""
-        mock_is_enabled.return_value = True
-        mock_get_correlation.return_value = "test-correlation-123"
-
         # Mock client creation
         client_data = {
             "first_name": "John",
@@ -45,7 +34,6 @@ class TestDatabaseServiceAudit:
         # Mock the client object
         mock_client = MagicMock()
         mock_client.id = uuid4()
-        db_service._ensure_session().add = MagicMock()
 
         with patch.object(db_service, "_log_action") as mock_log_action:
             # This would normally create a client, but we're testing the audit part
@@ -66,16 +54,8 @@ class TestDatabaseServiceAudit:
                 user_id="user123",
             )
 
-    @patch("services.database_service.log_crud_action")
-    @patch("services.database_service.get_correlation_id")
-    @patch("services.database_service.is_enabled")
-    async def test_update_client_audit_logging(
-        self, mock_is_enabled, mock_get_correlation, mock_log_crud, db_service
-    ):
+    def test_update_client_audit_logging(self, db_service):
         """Test that client updates trigger audit logging."""
-        mock_is_enabled.return_value = True
-        mock_get_correlation.return_value = "test-correlation-456"
-
         client_id = uuid4()
         old_values = {"first_name": "John", "email": "john@old.com"}
         new_values = {"first_name": "Johnny", "email": "johnny@new.com"}
@@ -100,16 +80,9 @@ class TestDatabaseServiceAudit:
                 user_id="user123",
             )
 
-    @patch("services.database_service.log_crud_action")
-    @patch("services.database_service.get_correlation_id")
-    @patch("services.database_service.is_enabled")
-    async def test_delete_client_audit_logging(
-        self, mock_is_enabled, mock_get_correlation, mock_log_crud, db_service
-    ):
+    @pytest.mark.asyncio
+    async def test_delete_client_audit_logging(self, db_service):
         """Test that client deletion triggers audit logging."""
-        mock_is_enabled.return_value = True
-        mock_get_correlation.return_value = "test-correlation-789"
-
         client_id = uuid4()
 
         # Mock existing client
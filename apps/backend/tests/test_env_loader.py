@@ -1,270 +1,172 @@
 """Tests for core/env_loader.py module."""
 
+import io
 import os
-import tempfile
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
+from core import env_loader
 from core.env_loader import (
     _load_env_file,
+    _parse_env_lines,
     get_environment_info,
     load_environment_config,
     validate_required_env_vars,
 )
 
 
-class TestLoadEnvironmentConfig:
-    """Test cases for load_environment_config function."""
-
-    def test_load_environment_config_test_env(self):
-        """Test loading test environment configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a temporary .env.test file
-            env_test_file = Path(temp_dir) / ".env.test"
-            env_test_file.write_text("TEST_VAR=test_value\n")
-
-            with patch("core.env_loader.Path") as mock_path:
-                # Mock the project root path
-                mock_path.return_value.parent.parent.parent.parent = Path(temp_dir)
-                mock_path.__file__ = "core/env_loader.py"
+@pytest.fixture(autouse=True)
+def env_snapshot():
+    """Restore os.environ after every test, whatever the loader set."""
+    saved = os.environ.copy()
+    yield
+    os.environ.clear()
+    os.environ.update(saved)
 
-                # Clear any existing TEST_VAR
-                if "TEST_VAR" in os.environ:
-                    del os.environ["TEST_VAR"]
 
-                load_environment_config("test")
+@pytest.fixture(scope="session")
+def env_files(tmp_path_factory):
+    """Project root holding one .env file per environment, shared by all tests."""
+    root = tmp_path_factory.mktemp("envs")
+    (root / ".env.test").write_text("TEST_VAR=test_value\nAUTO_VAR=auto_value\n")
+    (root / ".env.staging").write_text("STAGING_VAR=staging_value\n")
+    (root / ".env.production").write_text("PROD_VAR=prod_value\n")
+    (root / ".env").write_text("DEFAULT_VAR=default_value\n")
+    return root
 
-                assert os.environ.get("TEST_VAR") == "test_value"
 
-                # Clean up
-                if "TEST_VAR" in os.environ:
-                    del os.environ["TEST_VAR"]
+class TestLoadEnvironmentConfig:
+    """Test cases for load_environment_config function."""
 
-    def test_load_environment_config_staging_env(self):
-        """Test loading staging environment configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a temporary .env.staging file
-            env_staging_file = Path(temp_dir) / ".env.staging"
-            env_staging_file.write_text("STAGING_VAR=staging_value\n")
+    def test_load_environment_config_test_env(self, monkeypatch, env_files):
+        """Test loading test environment configuration."""
+        monkeypatch.setattr(env_loader, "_PROJECT_ROOT", env_files)
 
-            with patch("core.env_loader.Path") as mock_path:
-                # Mock the project root path
-                mock_path.return_value.parent.parent.parent.parent = Path(temp_dir)
-                mock_path.__file__ = "core/env_loader.py"
+        load_environment_config("test")
 
-                # Clear any existing STAGING_VAR
-                if "STAGING_VAR" in os.environ:
-                    del os.environ["STAGING_VAR"]
+        assert os.environ.get("TEST_VAR") == "test_value"
 
-                load_environment_config("staging")
+    def test_load_environment_config_staging_env(self, monkeypatch, env_files):
+        """Test loading staging environment configuration."""
+        monkeypatch.setattr(env_loader, "_PROJECT_ROOT", env_files)
 
-                assert os.environ.get("STAGING_VAR") == "staging_value"
+        load_environment_config("staging")
 
-                # Clean up
-                if "STAGING_VAR" in os.environ:
-                    del os.environ["STAGING_VAR"]
+        assert os.environ.get("STAGING_VAR") == "staging_value"
 
-    def test_load_environment_config_production_env(self):
+    def test_load_environment_config_production_env(self, monkeypatch, env_files):
         """Test loading production environment configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a temporary .env.production file
-            env_prod_file = Path(temp_dir) / ".env.production"
-            env_prod_file.write_text("PROD_VAR=prod_value\n")
+        monkeypatch.setattr(env_loader, "_PROJECT_ROOT", env_files)
 
-            with patch("core.env_loader.Path") as mock_path:
-                # Mock the project root path
-                mock_path.return_value.parent.parent.parent.parent = Path(temp_dir)
-                mock_path.__file__ = "core/env_loader.py"
+        load_environment_config("production")
 
-                # Clear any existing PROD_VAR
-                if "PROD_VAR" in os.environ:
-                    del os.environ["PROD_VAR"]
+        assert os.environ.get("PROD_VAR") == "prod_value"
 
-                load_environment_config("production")
-
-                assert os.environ.get("PROD_VAR") == "prod_value"
-
-                # Clean up
-                if "PROD_VAR" in os.environ:
-                    del os.environ["PROD_VAR"]
-
-    def test_load_environment_config_fallback_to_default(self):
+    def test_load_environment_config_fallback_to_default(self, monkeypatch, env_files):
         """Test fallback to default .env file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a temporary .env file
-            env_file = Path(temp_dir) / ".env"
-            env_file.write_text("DEFAULT_VAR=default_value\n")
-
-            with patch("core.env_loader.Path") as mock_path:
-                # Mock the project root path
-                mock_path.return_value.parent.parent.parent.parent = Path(temp_dir)
-                mock_path.__file__ = "core/env_loader.py"
-
-                # Clear any existing DEFAULT_VAR
-                if "DEFAULT_VAR" in os.environ:
-                    del os.environ["DEFAULT_VAR"]
+        monkeypatch.setattr(env_loader, "_PROJECT_ROOT", env_files)
 
-                load_environment_config("development")
+        load_environment_config("development")
 
-                assert os.environ.get("DEFAULT_VAR") == "default_value"
+        assert os.environ.get("DEFAULT_VAR") == "default_value"
 
-                # Clean up
-                if "DEFAULT_VAR" in os.environ:
-                    del os.environ["DEFAULT_VAR"]
-
-    def test_load_environment_config_no_env_specified(self):
+    def test_load_environment_config_no_env_specified(self, monkeypatch, env_files):
         """Test loading config when no environment is specified."""
-        with patch.dict(os.environ, {"ENVIRONMENT": "test"}, clear=False):
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Create a temporary .env.test file
-                env_test_file = Path(temp_dir) / ".env.test"
-                env_test_file.write_text("AUTO_VAR=auto_value\n")
-
-                with patch("core.env_loader.Path") as mock_path:
-                    # Mock the project root path
-                    mock_path.return_value.parent.parent.parent.parent = Path(temp_dir)
-                    mock_path.__file__ = "core/env_loader.py"
-
-                    # Clear any existing AUTO_VAR
-                    if "AUTO_VAR" in os.environ:
-                        del os.environ["AUTO_VAR"]
-
-                    load_environment_config()
+        monkeypatch.setenv("ENVIRONMENT", "test")
+        monkeypatch.setattr(env_loader, "_PROJECT_ROOT", env_files)
 
-                    assert os.environ.get("AUTO_VAR") == "auto_value"
+        load_environment_config()
 
-                    # Clean up
-                    if "AUTO_VAR" in os.environ:
-                        del os.environ["AUTO_VAR"]
+        assert os.environ.get("AUTO_VAR") == "auto_value"
 
-    def test_load_environment_config_no_file_found(self):
+    def test_load_environment_config_no_file_found(self, monkeypatch, tmp_path):
         """Test behavior when no .env file is found."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("core.env_loader.Path") as mock_path:
-                # Mock the project root path to empty directory
-                mock_path.return_value.parent.parent.parent.parent = Path(temp_dir)
-                mock_path.__file__ = "core/env_loader.py"
+        monkeypatch.setattr(env_loader, "_PROJECT_ROOT", tmp_path)
 
-                # Should not raise an exception
-                load_environment_config("nonexistent")
+        # Should not raise an exception
+        load_environment_config("nonexistent")
 
 
 class TestLoadEnvFile:
     """Test cases for _load_env_file function."""
 
-    def test_load_env_file_basic(self):
+    def test_load_env_file_basic(self, monkeypatch):
         """Test basic .env file loading."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-            f.write("KEY1=value1\n")
-            f.write("KEY2=value2\n")
-            f.flush()
+        monkeypatch.delenv("KEY1", raising=False)
+        monkeypatch.delenv("KEY2", raising=False)
 
-            # Clear any existing keys
-            for key in ["KEY1", "KEY2"]:
-                if key in os.environ:
-                    del os.environ[key]
+        _parse_env_lines(io.StringIO("KEY1=value1\nKEY2=value2\n"), "test.env")
 
-            _load_env_file(Path(f.name))
+        assert os.environ.get("KEY1") == "value1"
+        assert os.environ.get("KEY2") == "value2"
 
-            assert os.environ.get("KEY1") == "value1"
-            assert os.environ.get("KEY2") == "value2"
-
-            # Clean up
-            for key in ["KEY1", "KEY2"]:
-                if key in os.environ:
-                    del os.environ[key]
-            os.unlink(f.name)
-
-    def test_load_env_file_with_quotes(self):
+    def test_load_env_file_with_quotes(self, monkeypatch):
         """Test loading .env file with quoted values."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-            f.write('QUOTED_DOUBLE="double quoted value"\n')
-            f.write("QUOTED_SINGLE='single quoted value'\n")
-            f.flush()
-
-            # Clear any existing keys
-            for key in ["QUOTED_DOUBLE", "QUOTED_SINGLE"]:
-                if key in os.environ:
-                    del os.environ[key]
+        monkeypatch.delenv("QUOTED_DOUBLE", raising=False)
+        monkeypatch.delenv("QUOTED_SINGLE", raising=False)
 
-            _load_env_file(Path(f.name))
+        _parse_env_lines(
+            io.StringIO(
+                'QUOTED_DOUBLE="double quoted value"\n'
+                "QUOTED_SINGLE='single quoted value'\n"
+            ),
+            "test.env",
+        )
 
-            assert os.environ.get("QUOTED_DOUBLE") == "double quoted value"
-            assert os.environ.get("QUOTED_SINGLE") == "single quoted value"
+        assert os.environ.get("QUOTED_DOUBLE") == "double quoted value"
+        assert os.environ.get("QUOTED_SINGLE") == "single quoted value"
 
-            # Clean up
-            for key in ["QUOTED_DOUBLE", "QUOTED_SINGLE"]:
-                if key in os.environ:
-                    del os.environ[key]
-            os.unlink(f.name)
-
-    def test_load_env_file_skip_comments_and_empty_lines(self):
+    def test_load_env_file_skip_comments_and_empty_lines(self, monkeypatch):
         """Test that comments and empty lines are skipped."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-            f.write("# This is a comment\n")
-            f.write("\n")
-            f.write("VALID_KEY=valid_value\n")
-            f.write("# Another comment\n")
-            f.flush()
+        monkeypatch.delenv("VALID_KEY", raising=False)
+
+        _parse_env_lines(
+            io.StringIO(
+                "# This is a comment\n\nVALID_KEY=valid_value\n# Another comment\n"
+            ),
+            "test.env",
+        )
 
-            # Clear any existing key
-            if "VALID_KEY" in os.environ:
-                del os.environ["VALID_KEY"]
+        assert os.environ.get("VALID_KEY") == "valid_value"
 
-            _load_env_file(Path(f.name))
+    def test_load_env_file_preserves_existing_env_vars(self, monkeypatch):
+        """Test that existing environment variables are not overwritten."""
+        monkeypatch.setenv("EXISTING_VAR", "original_value")
 
-            assert os.environ.get("VALID_KEY") == "valid_value"
+        _parse_env_lines(io.StringIO("EXISTING_VAR=new_value\n"), "test.env")
 
-            # Clean up
-            if "VALID_KEY" in os.environ:
-                del os.environ["VALID_KEY"]
-            os.unlink(f.name)
+        # Should preserve original value
+        assert os.environ.get("EXISTING_VAR") == "original_value"
 
-    def test_load_env_file_preserves_existing_env_vars(self):
-        """Test that existing environment variables are not overwritten."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-            f.write("EXISTING_VAR=new_value\n")
-            f.flush()
+    def test_load_env_file_invalid_format(self, monkeypatch):
+        """Test handling of invalid line format."""
+        monkeypatch.delenv("VALID_KEY", raising=False)
+        monkeypatch.delenv("ANOTHER_VALID", raising=False)
 
-            # Set existing environment variable
-            os.environ["EXISTING_VAR"] = "original_value"
+        # Should not raise exception, just log warning
+        _parse_env_lines(
+            io.StringIO(
+                "VALID_KEY=valid_value\n"
+                "INVALID_LINE_NO_EQUALS\n"
+                "ANOTHER_VALID=another_value\n"
+            ),
+            "test.env",
+        )
 
-            _load_env_file(Path(f.name))
+        # Valid keys should still be loaded
+        assert os.environ.get("VALID_KEY") == "valid_value"
+        assert os.environ.get("ANOTHER_VALID") == "another_value"
 
-            # Should preserve original value
-            assert os.environ.get("EXISTING_VAR") == "original_value"
+    def test_load_env_file_reads_file(self, tmp_path, monkeypatch):
+        """Test loading variables from a .env file on disk."""
+        monkeypatch.delenv("FILE_KEY", raising=False)
+        env_file = tmp_path / "test.env"
+        env_file.write_text('# comment\nFILE_KEY="file value"\n')
 
-            # Clean up
-            del os.environ["EXISTING_VAR"]
-            os.unlink(f.name)
+        _load_env_file(env_file)
 
-    def test_load_env_file_invalid_format(self):
-        """Test handling of invalid line format."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-            f.write("VALID_KEY=valid_value\n")
-            f.write("INVALID_LINE_NO_EQUALS\n")
-            f.write("ANOTHER_VALID=another_value\n")
-            f.flush()
-
-            # Clear any existing keys
-            for key in ["VALID_KEY", "ANOTHER_VALID"]:
-                if key in os.environ:
-                    del os.environ[key]
-
-            # Should not raise exception, just log warning
-            _load_env_file(Path(f.name))
-
-            # Valid keys should still be loaded
-            assert os.environ.get("VALID_KEY") == "valid_value"
-            assert os.environ.get("ANOTHER_VALID") == "another_value"
-
-            # Clean up
-            for key in ["VALID_KEY", "ANOTHER_VALID"]:
-                if key in os.environ:
-                    del os.environ[key]
-            os.unlink(f.name)
+        assert os.environ.get("FILE_KEY") == "file value"
 
     def test_load_env_file_file_not_found(self):
         """Test handling of non-existent file."""
@@ -275,40 +177,19 @@ class TestLoadEnvFile:
 class TestGetEnvironmentInfo:
     """Test cases for get_environment_info function."""
 
-    def test_get_environment_info_defaults(self):
+    def test_get_environment_info_defaults(self, clean_env):
         """Test get_environment_info with default values."""
-        # Clear relevant environment variables
-        env_vars_to_clear = [
-            "ENVIRONMENT",
-            "DEBUG",
-            "LOG_LEVEL",
-            "DATABASE_URL",
-            "REDIS_URL",
-            "SECRET_KEY",
-            "JWT_SECRET_KEY",
-        ]
-        original_values = {}
-        for var in env_vars_to_clear:
-            if var in os.environ:
-                original_values[var] = os.environ[var]
-                del os.environ[var]
-
-        try:
-            info = get_environment_info()
-
-            assert info["environment"] == "development"
-            assert info["debug"] is False
-            assert info["log_level"] == "INFO"
-            assert info["database_url_set"] is False
-            assert info["redis_url_set"] is False
-            assert info["secret_key_set"] is False
-            assert info["jwt_secret_key_set"] is False
-        finally:
-            # Restore original values
-            for var, value in original_values.items():
-                os.environ[var] = value
-
-    def test_get_environment_info_with_values(self):
+        info = get_environment_info()
+
+        assert info["environment"] == "development"
+        assert info["debug"] is False
+        assert info["log_level"] == "INFO"
+        assert info["database_url_set"] is False
+        assert info["redis_url_set"] is False
+        assert info["secret_key_set"] is False
+        assert info["jwt_secret_key_set"] is False
+
+    def test_get_environment_info_with_values(self, monkeypatch):
         """Test get_environment_info with set values."""
         test_env_vars = {
             "ENVIRONMENT": "production",
@@ -320,31 +201,31 @@ class TestGetEnvironmentInfo:
             "JWT_SECRET_KEY": "test-jwt-secret",
         }
 
-        with patch.dict(os.environ, test_env_vars, clear=False):
-            info = get_environment_info()
+        for key, value in test_env_vars.items():
+            monkeypatch.setenv(key, value)
+
+        info = get_environment_info()
 
-            assert info["environment"] == "production"
-            assert info["debug"] is True
-            assert info["log_level"] == "DEBUG"
-            assert info["database_url_set"] is True
-            assert info["redis_url_set"] is True
-            assert info["secret_key_set"] is True
-            assert info["jwt_secret_key_set"] is True
+        assert info["environment"] == "production"
+        assert info["debug"] is True
+        assert info["log_level"] == "DEBUG"
+        assert info["database_url_set"] is True
+        assert info["redis_url_set"] is True
+        assert info["secret_key_set"] is True
+        assert info["jwt_secret_key_set"] is True
 
-    def test_get_environment_info_debug_false_variations(self):
+    @pytest.mark.parametrize("false_val", ["false", "False", "FALSE", "0", "no", "No"])
+    def test_get_environment_info_debug_false_variations(self, monkeypatch, false_val):
         """Test debug flag with various false values."""
-        false_values = ["false", "False", "FALSE", "0", "no", "No"]
+        monkeypatch.setenv("DEBUG", false_val)
 
-        for false_val in false_values:
-            with patch.dict(os.environ, {"DEBUG": false_val}, clear=False):
-                info = get_environment_info()
-                assert info["debug"] is False
+        assert get_environment_info()["debug"] is False
 
 
 class TestValidateRequiredEnvVars:
     """Test cases for validate_required_env_vars function."""
 
-    def test_validate_required_env_vars_all_present(self):
+    def test_validate_required_env_vars_all_present(self, monkeypatch):
         """Test validation when all required vars are present."""
         required_vars = {
             "SECRET_KEY": "test-secret",
@@ -353,51 +234,28 @@ class TestValidateRequiredEnvVars:
             "REDIS_URL": "redis://localhost:6379",
         }
 
-        with patch.dict(os.environ, required_vars, clear=False):
-            missing = validate_required_env_vars()
-            assert missing == []
+        for key, value in required_vars.items():
+            monkeypatch.setenv(key, value)
+
+        assert validate_required_env_vars() == []
 
-    def test_validate_required_env_vars_some_missing(self):
+    def test_validate_required_env_vars_some_missing(self, clean_env, monkeypatch):
         """Test validation when some required vars are missing."""
-        # Clear all required vars
-        required_vars = ["SECRET_KEY", "JWT_SECRET_KEY", "DATABASE_URL", "REDIS_URL"]
-        original_values = {}
-        for var in required_vars:
-            if var in os.environ:
-                original_values[var] = os.environ[var]
-                del os.environ[var]
-
-        try:
-            # Set only some vars
-            with patch.dict(
-                os.environ, {"SECRET_KEY": "test", "DATABASE_URL": "test"}, clear=False
-            ):
-                missing = validate_required_env_vars()
-                assert set(missing) == {"JWT_SECRET_KEY", "REDIS_URL"}
-        finally:
-            # Restore original values
-            for var, value in original_values.items():
-                os.environ[var] = value
-
-    def test_validate_required_env_vars_all_missing(self):
+        # Set only some vars
+        monkeypatch.setenv("SECRET_KEY", "test")
+        monkeypatch.setenv("DATABASE_URL", "test")
+
+        missing = validate_required_env_vars()
+        assert set(missing) == {"JWT_SECRET_KEY", "REDIS_URL"}
+
+    def test_validate_required_env_vars_all_missing(self, clean_env):
         """Test validation when all required vars are missing."""
-        # Clear all required vars
         required_vars = ["SECRET_KEY", "JWT_SECRET_KEY", "DATABASE_URL", "REDIS_URL"]
-        original_values = {}
-        for var in required_vars:
-            if var in os.environ:
-                original_values[var] = os.environ[var]
-                del os.environ[var]
-
-        try:
-            missing = validate_required_env_vars()
-            assert set(missing) == set(required_vars)
-        finally:
-            # Restore original values
-            for var, value in original_values.items():
-                os.environ[var] = value
-
-    def test_validate_required_env_vars_empty_values(self):
+
+        missing = validate_required_env_vars()
+        assert set(missing) == set(required_vars)
+
+    def test_validate_required_env_vars_empty_values(self, monkeypatch):
         """Test validation with empty string values."""
         empty_vars = {
             "SECRET_KEY": "",
@@ -406,7 +264,9 @@ class TestValidateRequiredEnvVars:
             "REDIS_URL": "",
         }
 
-        with patch.dict(os.environ, empty_vars, clear=False):
-            missing = validate_required_env_vars()
-            # Empty strings should be considered missing
-            assert set(missing) == set(empty_vars.keys())
+        for key, value in empty_vars.items():
+            monkeypatch.setenv(key, value)
+
+        missing = validate_required_env_vars()
+        # Empty strings should be considered missing
+        assert set(missing) == set(empty_vars.keys())
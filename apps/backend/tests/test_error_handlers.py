@@ -1,9 +1,10 @@
 """Tests for error handling utilities."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi import Request, status
+from fastapi import status
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
@@ -22,6 +23,13 @@ from utils.error_handlers import (
 )
 
 
+@pytest.fixture
+def mock_logger():
+    """Patch the error handlers module logger for one test."""
+    with patch("utils.error_handlers.logger") as logger:
+        yield logger
+
+
 class TestErrorResponse:
     """Test cases for ErrorResponse model."""
 
@@ -78,16 +86,65 @@ class TestAPIError:
         assert error.correlation_id == "custom-123"
 
 
-class TestValidationError:
-    """Test cases for ValidationError class."""
-
-    def test_validation_error_default(self):
-        """Test ValidationError with default values."""
-        error = ValidationError("Validation failed")
-
-        assert error.message == "Validation failed"
-        assert error.error_type == "VALIDATION_ERROR"
-        assert error.status_code == status.HTTP_400_BAD_REQUEST
+class TestAPIErrorSubclasses:
+    """Test cases for the APIError subclasses."""
+
+    @pytest.mark.parametrize(
+        "cls,default_message,error_type,status_code",
+        [
+            (
+                ValidationError,
+                "Request validation failed",
+                "VALIDATION_ERROR",
+                status.HTTP_400_BAD_REQUEST,
+            ),
+            (
+                AuthenticationError,
+                "Authentication failed",
+                "AUTHENTICATION_ERROR",
+                status.HTTP_401_UNAUTHORIZED,
+            ),
+            (
+                AuthorizationError,
+                "Access denied",
+                "AUTHORIZATION_ERROR",
+                status.HTTP_403_FORBIDDEN,
+            ),
+            (
+                NotFoundError,
+                "Resource not found",
+                "NOT_FOUND_ERROR",
+                status.HTTP_404_NOT_FOUND,
+            ),
+            (
+                DatabaseError,
+                "Database operation failed",
+                "DATABASE_ERROR",
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+            ),
+        ],
+    )
+    def test_error_defaults(self, cls, default_message, error_type, status_code):
+        """Test each subclass's default message, error type and status code."""
+        error = cls()
+
+        assert error.message == default_message
+        assert error.error_type == error_type
+        assert error.status_code == status_code
+
+    @pytest.mark.parametrize(
+        "cls,message",
+        [
+            (ValidationError, "Validation failed"),
+            (AuthenticationError, "Invalid token"),
+            (AuthorizationError, "Insufficient permissions"),
+            (NotFoundError, "User not found"),
+            (DatabaseError, "Connection failed"),
+        ],
+    )
+    def test_error_custom_message(self, cls, message):
+        """Test each subclass with a custom message."""
+        assert cls(message).message == message
 
     def test_validation_error_with_details(self):
         """Test ValidationError with details."""
@@ -99,78 +156,6 @@ class TestValidationError:
         assert error.correlation_id == "val-123"
 
 
-class TestAuthenticationError:
-    """Test cases for AuthenticationError class."""
-
-    def test_authentication_error_default(self):
-        """Test AuthenticationError with default message."""
-        error = AuthenticationError()
-
-        assert error.message == "Authentication failed"
-        assert error.error_type == "AUTHENTICATION_ERROR"
-        assert error.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_authentication_error_custom(self):
-        """Test AuthenticationError with custom message."""
-        error = AuthenticationError("Invalid token")
-
-        assert error.message == "Invalid token"
-
-
-class TestAuthorizationError:
-    """Test cases for AuthorizationError class."""
-
-    def test_authorization_error_default(self):
-        """Test AuthorizationError with default message."""
-        error = AuthorizationError()
-
-        assert error.message == "Access denied"
-        assert error.error_type == "AUTHORIZATION_ERROR"
-        assert error.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_authorization_error_custom(self):
-        """Test AuthorizationError with custom message."""
-        error = AuthorizationError("Insufficient permissions")
-
-        assert error.message == "Insufficient permissions"
-
-
-class TestNotFoundError:
-    """Test cases for NotFoundError class."""
-
-    def test_not_found_error_default(self):
-        """Test NotFoundError with default message."""
-        error = NotFoundError()
-
-        assert error.message == "Resource not found"
-        assert error.error_type == "NOT_FOUND_ERROR"
-        assert error.status_code == status.HTTP_404_NOT_FOUND
-
-    def test_not_found_error_custom(self):
-        """Test NotFoundError with custom message."""
-        error = NotFoundError("User not found")
-
-        assert error.message == "User not found"
-
-
-class TestDatabaseError:
-    """Test cases for DatabaseError class."""
-
-    def test_database_error_default(self):
-        """Test DatabaseError with default message."""
-        error = DatabaseError()
-
-        assert error.message == "Database operation failed"
-        assert error.error_type == "DATABASE_ERROR"
-        assert error.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-
-    def test_database_error_custom(self):
-        """Test DatabaseError with custom message."""
-        error = DatabaseError("Connection failed")
-
-        assert error.message == "Connection failed"
-
-
 class TestHandleDatabaseError:
     """Test cases for handle_database_error function."""
 
@@ -214,7 +199,6 @@ class TestHandleDatabaseError:
 class TestLogAndRaiseError:
     """Test cases for log_and_raise_error function."""
 
-    @patch("utils.error_handlers.logger")
     def test_log_and_raise_basic_error(self, mock_logger):
         """Test logging and raising basic APIError."""
         error = APIError("Test error", correlation_id="test-123")
@@ -224,7 +208,6 @@ class TestLogAndRaiseError:
 
         mock_logger.error.assert_called_once()
 
-    @patch("utils.error_handlers.logger")
     def test_log_and_raise_with_db_session(self, mock_logger):
         """Test logging with database session rollback."""
         mock_session = MagicMock()
@@ -236,8 +219,7 @@ class TestLogAndRaiseError:
         mock_session.rollback.assert_called_once()
 
     @patch("utils.error_handlers.log_authentication_event")
-    @patch("utils.error_handlers.logger")
-    def test_log_authentication_error(self, mock_logger, mock_audit_log):
+    def test_log_authentication_error(self, mock_audit_log, mock_logger):
         """Test logging authentication error with audit."""
         error = AuthenticationError("Invalid credentials")
 
@@ -257,7 +239,7 @@ class TestAPIErrorHandler:
     @pytest.mark.asyncio
     async def test_api_error_handler(self):
         """Test API error handler returns proper JSONResponse."""
-        request = MagicMock(spec=Request)
+        request = SimpleNamespace(url=SimpleNamespace(path="/test/path"), method="GET")
         error = APIError(
             "Test error",
             error_type="TEST_ERROR",
@@ -277,13 +259,10 @@ class TestGeneralExceptionHandler:
 
     @pytest.mark.asyncio
     @patch("utils.error_handlers.get_correlation_id")
-    @patch("utils.error_handlers.logger")
-    async def test_general_exception_handler(self, mock_logger, mock_get_corr):
+    async def test_general_exception_handler(self, mock_get_corr, mock_logger):
         """Test general exception handler."""
         mock_get_corr.return_value = "test-correlation-123"
-        request = MagicMock(spec=Request)
-        request.url.path = "/test/path"
-        request.method = "GET"
+        request = SimpleNamespace(url=SimpleNamespace(path="/test/path"), method="GET")
 
         exception = ValueError("Test exception")
 
@@ -295,15 +274,12 @@ class TestGeneralExceptionHandler:
 
     @pytest.mark.asyncio
     @patch("utils.error_handlers.get_correlation_id")
-    @patch("utils.error_handlers.logger")
     async def test_general_exception_handler_correlation_error(
-        self, mock_logger, mock_get_corr
+        self, mock_get_corr, mock_logger
     ):
         """Test general exception handler when correlation ID fails."""
         mock_get_corr.side_effect = Exception("Correlation error")
-        request = MagicMock(spec=Request)
-        request.url.path = "/test/path"
-        request.method = "POST"
+        request = SimpleNamespace(url=SimpleNamespace(path="/test/path"), method="POST")
 
         exception = RuntimeError("Test runtime error")
 
@@ -1,11 +1,10 @@
 """Tests for events API endpoints."""
 
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
 
 import pytest
-from fastapi import HTTPException
-from fastapi.testclient import TestClient
+from fastapi import BackgroundTasks, HTTPException
+from pydantic import TypeAdapter
 
 from api.events import (
     ETLStatusResponse,
@@ -13,214 +12,230 @@ from api.events import (
     PublishEventRequest,
     PublishEventResponse,
     get_etl_service,
+    get_etl_status,
     get_event_bus_service,
+    get_event_bus_status,
     get_event_types,
     publish_event,
     router,
+    start_etl_pipeline,
+    stop_etl_pipeline,
 )
 from schemas.events import EventSeverity, EventType
 
-try:
-    from main import app
-except ImportError:
-    from fastapi import FastAPI
-
-    app = FastAPI()
-
-
-class TestEventsAPI:
-    """Test cases for events API endpoints."""
-
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    @pytest.fixture
-    def mock_event_bus(self):
-        """Mock event bus service."""
-        mock_bus = AsyncMock()
-        mock_bus.publish_event.return_value = str(uuid4())
-        mock_bus._redis = MagicMock()  # Simulate connected state
-        mock_bus.environment = "test"
-        mock_bus._subscribers = ["subscriber1", "subscriber2"]
-        mock_bus.get_stream_info.return_value = {
-            "length": 100,
-            "first_entry_id": "1234567890-0",
-            "last_entry_id": "1234567891-0",
-        }
-        return mock_bus
-
-    @pytest.fixture
-    def mock_etl_service(self):
-        """Mock ETL service."""
-        mock_etl = MagicMock()
-        mock_etl.get_metrics.return_value = {
-            "running": True,
-            "events_processed": 1000,
-            "batches_processed": 50,
-            "errors_count": 2,
-            "buffer_size": 25,
-            "environment": "test",
-            "s3_bucket": "test-bucket",
-        }
-        return mock_etl
-
-    @pytest.fixture
-    def sample_crud_event_request(self):
-        """Sample CRUD event request data."""
-        return {
-            "event_type": EventType.USER_UPDATED,
-            "resource_type": "patient",
-            "resource_id": "patient-123",
-            "severity": EventSeverity.MEDIUM,
-            "metadata": {"source": "api"},
-            "user_id": "user-456",
-            "operation": "UPDATE",
-            "changes": {"name": "John Doe"},
-        }
+# Fixed IDs; no test here relies on uniqueness
+_FAKE_UUID = "00000000-0000-4000-8000-000000000000"
+_CORRELATION_ID = "test-correlation-id"
+
+_EXPECTED_EVENT_TYPES = frozenset(event_type.value for event_type in EventType)
+_EXPECTED_SEVERITIES = frozenset(severity.value for severity in EventSeverity)
+
+# (endpoint, status word, action named in messages)
+_ETL_CONTROL_CASES = [
+    pytest.param(start_etl_pipeline, "starting", "start", id="start"),
+    pytest.param(stop_etl_pipeline, "stopping", "stop", id="stop"),
+]
+
+# Validates dicts straight into PublishEventRequest instances
+_REQUEST_ADAPTER = TypeAdapter(PublishEventRequest)
+
+_CRUD_EVENT_REQUEST = PublishEventRequest(
+    event_type=EventType.USER_UPDATED,
+    resource_type="patient",
+    resource_id="patient-123",
+    severity=EventSeverity.MEDIUM,
+    metadata={"source": "api"},
+    user_id="user-456",
+    operation="UPDATE",
+    changes={"name": "John Doe"},
+)
 
-    @pytest.fixture
-    def sample_auth_event_request(self):
-        """Sample auth event request data."""
-        return {
-            "event_type": EventType.USER_CREATED,
-            "resource_type": "user",
-            "resource_id": "user-123",
-            "severity": EventSeverity.LOW,
-            "metadata": {"source": "auth"},
-            "user_id": "user-123",
-            "auth_type": "LOGIN",
-            "success": True,
-            "ip_address": "192.168.1.1",
-            "user_agent": "Mozilla/5.0",
-        }
+_AUTH_EVENT_REQUEST = PublishEventRequest(
+    event_type=EventType.USER_CREATED,
+    resource_type="user",
+    resource_id="user-123",
+    severity=EventSeverity.LOW,
+    metadata={"source": "auth"},
+    user_id="user-123",
+    auth_type="LOGIN",
+    success=True,
+    ip_address="192.168.1.1",
+    user_agent="Mozilla/5.0",
+)
 
-    @pytest.fixture
-    def sample_system_event_request(self):
-        """Sample system event request data."""
-        return {
-            "event_type": EventType.SYSTEM_ERROR,
-            "resource_type": "system",
-            "resource_id": "component-123",
-            "severity": EventSeverity.HIGH,
-            "metadata": {"source": "system"},
-            "user_id": None,
-            "component": "database",
-            "error_code": "DB_CONNECTION_FAILED",
-            "stack_trace": "Traceback...",
-        }
+_SYSTEM_EVENT_REQUEST = PublishEventRequest(
+    event_type=EventType.SYSTEM_ERROR,
+    resource_type="system",
+    resource_id="component-123",
+    severity=EventSeverity.HIGH,
+    metadata={"source": "system"},
+    user_id=None,
+    component="database",
+    error_code="DB_CONNECTION_FAILED",
+    stack_trace="Traceback...",
+)
 
-    @pytest.fixture
-    def sample_business_event_request(self):
-        """Sample business event request data."""
-        return {
-            "event_type": EventType.APPOINTMENT_SCHEDULED,
-            "resource_type": "appointment",
-            "resource_id": "appt-123",
-            "severity": EventSeverity.LOW,
-            "metadata": {"source": "scheduler"},
-            "user_id": "user-456",
-            "business_process": "appointment_booking",
-            "outcome": "SUCCESS",
-            "duration_ms": 1500,
-        }
+_BUSINESS_EVENT_REQUEST = PublishEventRequest(
+    event_type=EventType.APPOINTMENT_SCHEDULED,
+    resource_type="appointment",
+    resource_id="appt-123",
+    severity=EventSeverity.LOW,
+    metadata={"source": "scheduler"},
+    user_id="user-456",
+    business_process="appointment_booking",
+    outcome="SUCCESS",
+    duration_ms=1500,
+)
 
-    @pytest.mark.asyncio
-    async def test_publish_crud_event_success(
-        self, sample_crud_event_request, mock_event_bus
-    ):
-        """Test successful CRUD event publishing."""
-        request = PublishEventRequest(**sample_crud_event_request)
-        correlation_id = "test-correlation-id"
-
-        with patch("api.events.logger") as mock_logger:
-            response = await publish_event(
-                request=request,
-                correlation_id=correlation_id,
-                event_bus=mock_event_bus,
-            )
 
-        assert isinstance(response, PublishEventResponse)
-        assert response.correlation_id == correlation_id
-        assert response.status == "published"
+class _RaisingBackgroundTasks(BackgroundTasks):
+    """BackgroundTasks whose add_task always fails."""
 
-        # Verify event bus was called
-        mock_event_bus.publish_event.assert_called_once()
-        published_event = mock_event_bus.publish_event.call_args[0][0]
-        assert published_event.event_type == EventType.USER_UPDATED
-        assert published_event.operation == "UPDATE"
-        assert published_event.changes == {"name": "John Doe"}
+    def add_task(self, *args, **kwargs):
+        raise RuntimeError("add_task failed")
 
-        # Verify logging
-        mock_logger.info.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_publish_auth_event_success(
-        self, sample_auth_event_request, mock_event_bus
-    ):
-        """Test successful auth event publishing."""
-        request = PublishEventRequest(**sample_auth_event_request)
-        correlation_id = "test-correlation-id"
+@pytest.fixture(autouse=True)
+def mock_logger(monkeypatch):
+    """Replace the events API logger for every test in this module."""
+    logger = MagicMock()
+    monkeypatch.setattr("api.events.logger", logger)
+    return logger
 
-        response = await publish_event(
-            request=request,
-            correlation_id=correlation_id,
-            event_bus=mock_event_bus,
+
+class _FakeEventBus:
+    """Minimal event bus stand-in exposing what the events API reads."""
+
+    def __init__(self):
+        self._redis = object()  # Simulate connected state
+        self.environment = "test"
+        self._subscribers = ["subscriber1", "subscriber2"]
+        # AsyncMocks only where tests inspect calls or set side effects
+        self.publish_event = AsyncMock(return_value=_FAKE_UUID)
+        self.get_stream_info = AsyncMock(
+            return_value={
+                "length": 100,
+                "first_entry_id": "1234567890-0",
+                "last_entry_id": "1234567891-0",
+            }
         )
 
-        assert isinstance(response, PublishEventResponse)
+    def reset_mock(self):
+        """Clear recorded calls and side effects, keeping return values."""
+        self.publish_event.reset_mock(side_effect=True)
+        self.get_stream_info.reset_mock(side_effect=True)
 
-        # Verify event bus was called with auth event
-        published_event = mock_event_bus.publish_event.call_args[0][0]
-        assert published_event.auth_type == "LOGIN"
-        assert published_event.success is True
-        assert published_event.ip_address == "192.168.1.1"
-        assert published_event.user_agent == "Mozilla/5.0"
 
-    @pytest.mark.asyncio
-    async def test_publish_system_event_success(
-        self, sample_system_event_request, mock_event_bus
-    ):
-        """Test successful system event publishing."""
-        request = PublishEventRequest(**sample_system_event_request)
-        correlation_id = "test-correlation-id"
+@pytest.fixture(scope="session")
+def _event_bus_template():
+    """Event bus stand-in built once for the whole session."""
+    return _FakeEventBus()
 
-        response = await publish_event(
-            request=request,
-            correlation_id=correlation_id,
-            event_bus=mock_event_bus,
-        )
 
-        assert isinstance(response, PublishEventResponse)
+@pytest.fixture
+def mock_event_bus(_event_bus_template):
+    """Mock event bus service; calls and side effects are reset after each test."""
+    yield _event_bus_template
+    _event_bus_template.reset_mock()
+
+
+@pytest.fixture(scope="session")
+def _etl_service_template():
+    """ETL service mock configured once for the whole session."""
+    mock_etl = MagicMock()
+    mock_etl.get_metrics.return_value = {
+        "running": True,
+        "events_processed": 1000,
+        "batches_processed": 50,
+        "errors_count": 2,
+        "buffer_size": 25,
+        "environment": "test",
+        "s3_bucket": "test-bucket",
+    }
+    return mock_etl
+
+
+@pytest.fixture
+def mock_etl_service(_etl_service_template):
+    """Mock ETL service; calls and side effects are reset after each test."""
+    yield _etl_service_template
+    _etl_service_template.reset_mock(side_effect=True)
+
+
+@pytest.fixture
+def bg_tasks():
+    """Fresh BackgroundTasks for the ETL start/stop endpoints."""
+    return BackgroundTasks()
 
-        # Verify event bus was called with system event
-        published_event = mock_event_bus.publish_event.call_args[0][0]
-        assert published_event.component == "database"
-        assert published_event.error_code == "DB_CONNECTION_FAILED"
-        assert published_event.stack_trace == "Traceback..."
+
+class TestEventsPublish:
+    """Tests for the publish_event endpoint."""
 
     @pytest.mark.asyncio
-    async def test_publish_business_event_success(
-        self, sample_business_event_request, mock_event_bus
+    @pytest.mark.parametrize(
+        "payload,expected",
+        [
+            (
+                _CRUD_EVENT_REQUEST,
+                {
+                    "event_type": EventType.USER_UPDATED,
+                    "operation": "UPDATE",
+                    "changes": {"name": "John Doe"},
+                },
+            ),
+            (
+                _AUTH_EVENT_REQUEST,
+                {
+                    "auth_type": "LOGIN",
+                    "success": True,
+                    "ip_address": "192.168.1.1",
+                    "user_agent": "Mozilla/5.0",
+                },
+            ),
+            (
+                _SYSTEM_EVENT_REQUEST,
+                {
+                    "component": "database",
+                    "error_code": "DB_CONNECTION_FAILED",
+                    "stack_trace": "Traceback...",
+                },
+            ),
+            (
+                _BUSINESS_EVENT_REQUEST,
+                {
+                    "business_process": "appointment_booking",
+                    "outcome": "SUCCESS",
+                    "duration_ms": 1500,
+                },
+            ),
+        ],
+        ids=["crud", "auth", "system", "business"],
+    )
+    async def test_publish_event_success(
+        self, payload, expected, mock_event_bus, mock_logger
     ):
-        """Test successful business event publishing."""
-        request = PublishEventRequest(**sample_business_event_request)
-        correlation_id = "test-correlation-id"
-
+        """Test successful publishing of each event category."""
         response = await publish_event(
-            request=request,
-            correlation_id=correlation_id,
+            request=payload,
+            correlation_id=_CORRELATION_ID,
             event_bus=mock_event_bus,
         )
 
         assert isinstance(response, PublishEventResponse)
+        assert response.correlation_id == _CORRELATION_ID
+        assert response.status == "published"
 
-        # Verify event bus was called with business event
+        # Verify event bus was called with the category-specific fields
+        mock_event_bus.publish_event.assert_called_once()
         published_event = mock_event_bus.publish_event.call_args[0][0]
-        assert published_event.business_process == "appointment_booking"
-        assert published_event.outcome == "SUCCESS"
-        assert published_event.duration_ms == 1500
+        for attr, value in expected.items():
+            assert getattr(published_event, attr) == value
+
+        # The shared request model must not pick up the event category tag
+        assert "category" not in payload.metadata
+
+        # Verify logging
+        mock_logger.info.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_publish_base_event_success(self, mock_event_bus):
@@ -233,12 +248,11 @@ class TestEventsAPI:
             "metadata": {"source": "system"},
             "user_id": None,
         }
-        request = PublishEventRequest(**request_data)
-        correlation_id = "test-correlation-id"
+        request = _REQUEST_ADAPTER.validate_python(request_data)
 
         response = await publish_event(
             request=request,
-            correlation_id=correlation_id,
+            correlation_id=_CORRELATION_ID,
             event_bus=mock_event_bus,
         )
 
@@ -249,22 +263,16 @@ class TestEventsAPI:
         assert published_event.event_type == EventType.SYSTEM_ERROR
 
     @pytest.mark.asyncio
-    async def test_publish_event_failure(
-        self, sample_crud_event_request, mock_event_bus
-    ):
+    async def test_publish_event_failure(self, mock_event_bus, mock_logger):
         """Test event publishing failure."""
         mock_event_bus.publish_event.side_effect = Exception("Bus error")
 
-        request = PublishEventRequest(**sample_crud_event_request)
-        correlation_id = "test-correlation-id"
-
-        with patch("api.events.logger") as mock_logger:
-            with pytest.raises(HTTPException) as exc_info:
-                await publish_event(
-                    request=request,
-                    correlation_id=correlation_id,
-                    event_bus=mock_event_bus,
-                )
+        with pytest.raises(HTTPException) as exc_info:
+            await publish_event(
+                request=_CRUD_EVENT_REQUEST,
+                correlation_id=_CORRELATION_ID,
+                event_bus=mock_event_bus,
+            )
 
         assert exc_info.value.status_code == 500
         assert "Event publishing failed" in str(exc_info.value.detail)
@@ -272,11 +280,61 @@ class TestEventsAPI:
         # Verify error logging
         mock_logger.error.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_publish_event_with_default_outcome(self, mock_event_bus):
+        """Test business event with default outcome."""
+        request_data = {
+            "event_type": EventType.APPOINTMENT_SCHEDULED,
+            "resource_type": "appointment",
+            "resource_id": "appt-123",
+            "business_process": "appointment_booking",
+            # outcome not provided, should default to "SUCCESS"
+        }
+        request = _REQUEST_ADAPTER.validate_python(request_data)
+
+        response = await publish_event(
+            request=request,
+            correlation_id=_CORRELATION_ID,
+            event_bus=mock_event_bus,
+        )
+
+        assert isinstance(response, PublishEventResponse)
+
+        # Verify default outcome is set
+        published_event = mock_event_bus.publish_event.call_args[0][0]
+        assert published_event.outcome == "SUCCESS"
+
+    @pytest.mark.asyncio
+    async def test_publish_event_with_default_success(self, mock_event_bus):
+        """Test auth event with default success value."""
+        request_data = {
+            "event_type": EventType.USER_CREATED,
+            "resource_type": "user",
+            "resource_id": "user-123",
+            "auth_type": "LOGIN",
+            # success not provided, should default to False
+        }
+        request = _REQUEST_ADAPTER.validate_python(request_data)
+
+        response = await publish_event(
+            request=request,
+            correlation_id=_CORRELATION_ID,
+            event_bus=mock_event_bus,
+        )
+
+        assert isinstance(response, PublishEventResponse)
+
+        # Verify default success is set
+        published_event = mock_event_bus.publish_event.call_args[0][0]
+        assert published_event.success is False
+
+
+class TestEventsStatus:
+    """Tests for event bus and ETL status/control endpoints."""
+
     @pytest.mark.asyncio
     async def test_get_event_bus_status_success(self, mock_event_bus):
         """Test successful event bus status retrieval."""
-        from api.events import get_event_bus_status
-
         response = await get_event_bus_status(event_bus=mock_event_bus)
 
         assert isinstance(response, EventBusStatusResponse)
@@ -286,15 +344,12 @@ class TestEventsAPI:
         assert response.stream_info["length"] == 100
 
     @pytest.mark.asyncio
-    async def test_get_event_bus_status_failure(self, mock_event_bus):
+    async def test_get_event_bus_status_failure(self, mock_event_bus, mock_logger):
         """Test event bus status retrieval failure."""
-        from api.events import get_event_bus_status
-
         mock_event_bus.get_stream_info.side_effect = Exception("Status error")
 
-        with patch("api.events.logger") as mock_logger:
-            with pytest.raises(HTTPException) as exc_info:
-                await get_event_bus_status(event_bus=mock_event_bus)
+        with pytest.raises(HTTPException) as exc_info:
+            await get_event_bus_status(event_bus=mock_event_bus)
 
         assert exc_info.value.status_code == 500
         assert "Status retrieval failed" in str(exc_info.value.detail)
@@ -305,8 +360,6 @@ class TestEventsAPI:
     @pytest.mark.asyncio
     async def test_get_etl_status_success(self, mock_etl_service):
         """Test successful ETL status retrieval."""
-        from api.events import get_etl_status
-
         response = await get_etl_status(etl_pipeline=mock_etl_service)
 
         assert isinstance(response, ETLStatusResponse)
@@ -319,15 +372,12 @@ class TestEventsAPI:
         assert response.s3_bucket == "test-bucket"
 
     @pytest.mark.asyncio
-    async def test_get_etl_status_failure(self, mock_etl_service):
+    async def test_get_etl_status_failure(self, mock_etl_service, mock_logger):
         """Test ETL status retrieval failure."""
-        from api.events import get_etl_status
-
         mock_etl_service.get_metrics.side_effect = Exception("ETL error")
 
-        with patch("api.events.logger") as mock_logger:
-            with pytest.raises(HTTPException) as exc_info:
-                await get_etl_status(etl_pipeline=mock_etl_service)
+        with pytest.raises(HTTPException) as exc_info:
+            await get_etl_status(etl_pipeline=mock_etl_service)
 
         assert exc_info.value.status_code == 500
         assert "ETL status retrieval failed" in str(exc_info.value.detail)
@@ -336,182 +386,40 @@ class TestEventsAPI:
         mock_logger.error.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_start_etl_pipeline_success(self, mock_etl_service):
-        """Test successful ETL pipeline start."""
-        from fastapi import BackgroundTasks
-
-        from api.events import start_etl_pipeline
-
-        background_tasks = BackgroundTasks()
-
-        with patch("api.events.logger") as mock_logger:
-            response = await start_etl_pipeline(
-                background_tasks=background_tasks,
-                etl_pipeline=mock_etl_service,
-            )
+    @pytest.mark.parametrize("endpoint,status,action", _ETL_CONTROL_CASES)
+    async def test_etl_pipeline_control_success(
+        self, endpoint, status, action, bg_tasks, mock_etl_service, mock_logger
+    ):
+        """Test successful ETL pipeline start/stop."""
+        response = await endpoint(
+            background_tasks=bg_tasks,
+            etl_pipeline=mock_etl_service,
+        )
 
-        assert response["status"] == "starting"
-        assert "ETL pipeline start initiated" in response["message"]
+        assert response["status"] == status
+        assert f"ETL pipeline {action} initiated" in response["message"]
 
         # Verify logging
         mock_logger.info.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_start_etl_pipeline_failure(self, mock_etl_service):
-        """Test ETL pipeline start failure."""
-        from fastapi import BackgroundTasks
-
-        from api.events import start_etl_pipeline
-
-        background_tasks = BackgroundTasks()
-
-        with patch("api.events.logger") as mock_logger:
-            with patch.object(
-                background_tasks,
-                "add_task",
-                side_effect=Exception("Start error"),
-            ):
-                with pytest.raises(HTTPException) as exc_info:
-                    await start_etl_pipeline(
-                        background_tasks=background_tasks,
-                        etl_pipeline=mock_etl_service,
-                    )
-
-        assert exc_info.value.status_code == 500
-        assert "ETL pipeline start failed" in str(exc_info.value.detail)
-
-        # Verify error logging
-        mock_logger.error.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_stop_etl_pipeline_success(self, mock_etl_service):
-        """Test successful ETL pipeline stop."""
-        from fastapi import BackgroundTasks
-
-        from api.events import stop_etl_pipeline
-
-        background_tasks = BackgroundTasks()
-
-        with patch("api.events.logger") as mock_logger:
-            response = await stop_etl_pipeline(
-                background_tasks=background_tasks,
+    @pytest.mark.parametrize("endpoint,status,action", _ETL_CONTROL_CASES)
+    async def test_etl_pipeline_control_failure(
+        self, endpoint, status, action, mock_etl_service, mock_logger
+    ):
+        """Test ETL pipeline start/stop failure."""
+        with pytest.raises(HTTPException) as exc_info:
+            await endpoint(
+                background_tasks=_RaisingBackgroundTasks(),
                 etl_pipeline=mock_etl_service,
             )
 
-        assert response["status"] == "stopping"
-        assert "ETL pipeline stop initiated" in response["message"]
-
-        # Verify logging
-        mock_logger.info.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_stop_etl_pipeline_failure(self, mock_etl_service):
-        """Test ETL pipeline stop failure."""
-        from fastapi import BackgroundTasks
-
-        from api.events import stop_etl_pipeline
-
-        background_tasks = BackgroundTasks()
-
-        with patch("api.events.logger") as mock_logger:
-            with patch.object(
-                background_tasks,
-                "add_task",
-                side_effect=Exception("Stop error"),
-            ):
-                with pytest.raises(HTTPException) as exc_info:
-                    await stop_etl_pipeline(
-                        background_tasks=background_tasks,
-                        etl_pipeline=mock_etl_service,
-                    )
-
         assert exc_info.value.status_code == 500
-        assert "ETL pipeline stop failed" in str(exc_info.value.detail)
+        assert f"ETL pipeline {action} failed" in str(exc_info.value.detail)
 
         # Verify error logging
         mock_logger.error.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_get_event_types(self):
-        """Test get_event_types endpoint."""
-        response = await get_event_types()
-
-        assert "event_types" in response
-        assert "severities" in response
-        assert isinstance(response["event_types"], list)
-        assert isinstance(response["severities"], list)
-
-        # Verify some expected values
-        event_types = response["event_types"]
-        severities = response["severities"]
-
-        assert "user.created" in event_types
-        assert "user.updated" in event_types
-        assert "low" in severities
-        assert "high" in severities
-
-    def test_publish_event_request_model_validation(self):
-        """Test PublishEventRequest model validation."""
-        # Valid minimal request
-        valid_data = {
-            "event_type": EventType.USER_CREATED,
-            "resource_type": "user",
-            "resource_id": "user-123",
-        }
-        request = PublishEventRequest(**valid_data)
-        assert request.event_type == EventType.USER_CREATED
-        assert request.severity == EventSeverity.LOW  # Default value
-        assert request.metadata == {}  # Default value
-
-    def test_publish_event_response_model(self):
-        """Test PublishEventResponse model."""
-        event_id = str(uuid4())
-        correlation_id = "test-correlation-id"
-
-        response = PublishEventResponse(
-            event_id=event_id,
-            correlation_id=correlation_id,
-        )
-
-        assert response.event_id == event_id
-        assert response.correlation_id == correlation_id
-        assert response.status == "published"  # Default value
-
-    def test_event_bus_status_response_model(self):
-        """Test EventBusStatusResponse model."""
-        response = EventBusStatusResponse(
-            connected=True,
-            environment="test",
-            stream_info={"length": 100},
-            subscribers=2,
-        )
-
-        assert response.connected is True
-        assert response.environment == "test"
-        stream_info = getattr(response, "stream_info", {})
-        assert stream_info.get("length") == 100
-        assert response.subscribers == 2
-
-    def test_etl_status_response_model(self):
-        """Test ETLStatusResponse model."""
-        response = ETLStatusResponse(
-            running=True,
-            events_processed=1000,
-            batches_processed=50,
-            errors_count=2,
-            buffer_size=25,
-            environment="test",
-            s3_bucket="test-bucket",
-        )
-
-        assert response.running is True
-        assert response.events_processed == 1000
-        assert response.batches_processed == 50
-        assert response.errors_count == 2
-        assert response.buffer_size == 25
-        assert response.environment == "test"
-        assert response.s3_bucket == "test-bucket"
-
     @pytest.mark.asyncio
     async def test_dependency_injection_functions(self):
         """Test dependency injection functions."""
@@ -533,57 +441,78 @@ class TestEventsAPI:
             assert result == mock_etl
             mock_get_etl.assert_called_once()
 
-    def test_router_configuration(self):
-        """Test router configuration."""
-        assert router.prefix == "/events"
-        assert "events" in router.tags
 
-    @pytest.mark.asyncio
-    async def test_publish_event_with_default_outcome(self, mock_event_bus):
-        """Test business event with default outcome."""
-        request_data = {
-            "event_type": EventType.APPOINTMENT_SCHEDULED,
-            "resource_type": "appointment",
-            "resource_id": "appt-123",
-            "business_process": "appointment_booking",
-            # outcome not provided, should default to "SUCCESS"
-        }
-        request = PublishEventRequest(**request_data)
-        correlation_id = "test-correlation-id"
-
-        response = await publish_event(
-            request=request,
-            correlation_id=correlation_id,
-            event_bus=mock_event_bus,
-        )
-
-        assert isinstance(response, PublishEventResponse)
-
-        # Verify default outcome is set
-        published_event = mock_event_bus.publish_event.call_args[0][0]
-        assert published_event.outcome == "SUCCESS"
+class TestEventsModels:
+    """Tests for request/response models and router metadata."""
 
     @pytest.mark.asyncio
-    async def test_publish_event_with_default_success(self, mock_event_bus):
-        """Test auth event with default success value."""
-        request_data = {
-            "event_type": EventType.USER_CREATED,
-            "resource_type": "user",
-            "resource_id": "user-123",
-            "auth_type": "LOGIN",
-            # success not provided, should default to False
-        }
-        request = PublishEventRequest(**request_data)
-        correlation_id = "test-correlation-id"
+    async def test_get_event_types(self):
+        """Test get_event_types endpoint."""
+        response = await get_event_types()
 
-        response = await publish_event(
-            request=request,
-            correlation_id=correlation_id,
-            event_bus=mock_event_bus,
-        )
+        assert isinstance(response["event_types"], list)
+        assert isinstance(response["severities"], list)
 
-        assert isinstance(response, PublishEventResponse)
+        # Every enum member is listed, including the well-known ones
+        assert frozenset(response["event_types"]) == _EXPECTED_EVENT_TYPES
+        assert frozenset(response["severities"]) == _EXPECTED_SEVERITIES
+        assert {"user.created", "user.updated"} <= _EXPECTED_EVENT_TYPES
+        assert {"low", "high"} <= _EXPECTED_SEVERITIES
+
+    @pytest.mark.parametrize(
+        "cls,kwargs,defaults",
+        [
+            pytest.param(
+                PublishEventRequest,
+                {
+                    "event_type": EventType.USER_CREATED,
+                    "resource_type": "user",
+                    "resource_id": "user-123",
+                },
+                {"severity": EventSeverity.LOW, "metadata": {}},
+                id="publish_request",
+            ),
+            pytest.param(
+                PublishEventResponse,
+                {"event_id": _FAKE_UUID, "correlation_id": _CORRELATION_ID},
+                {"status": "published"},
+                id="publish_response",
+            ),
+            pytest.param(
+                EventBusStatusResponse,
+                {
+                    "connected": True,
+                    "environment": "test",
+                    "stream_info": {"length": 100},
+                    "subscribers": 2,
+                },
+                {},
+                id="event_bus_status",
+            ),
+            pytest.param(
+                ETLStatusResponse,
+                {
+                    "running": True,
+                    "events_processed": 1000,
+                    "batches_processed": 50,
+                    "errors_count": 2,
+                    "buffer_size": 25,
+                    "environment": "test",
+                    "s3_bucket": "test-bucket",
+                },
+                {},
+                id="etl_status",
+            ),
+        ],
+    )
+    def test_model(self, cls, kwargs, defaults):
+        """Models keep the given fields and fill in their defaults."""
+        # Unset optional fields dump as None; only compare populated ones
+        dumped = cls(**kwargs).model_dump(exclude_none=True)
+
+        assert dumped == {**kwargs, **defaults}
 
-        # Verify default success is set
-        published_event = mock_event_bus.publish_event.call_args[0][0]
-        assert published_event.success is False
+    def test_router_configuration(self):
+        """Test router configuration."""
+        assert router.prefix == "/events"
+        assert "events" in router.tags
@@ -3,6 +3,7 @@
 from datetime import date
 from decimal import Decimal
 
+import factory
 import pytest
 
 from factories import (
@@ -14,6 +15,7 @@ from factories import (
     PracticeProfileFactory,
     ProviderFactory,
 )
+from factories.ledger import BILLING_CODES, TRANSACTION_TYPES
 from models import (
     Appointment,
     Client,
@@ -24,16 +26,52 @@ from models import (
     Provider,
 )
 
+VALID_BILLING_CODES = frozenset(BILLING_CODES)
+VALID_TRANSACTION_TYPES = frozenset(TRANSACTION_TYPES)
+
+# Every factory the tests below create through, directly or via SubFactory
+_FACTORIES = (
+    AppointmentFactory,
+    ClientFactory,
+    LedgerEntryFactory,
+    LocationFactory,
+    NoteFactory,
+    PracticeProfileFactory,
+    ProviderFactory,
+)
+
+
+def _assert_hipaa_safe(obj):
+    """Assert the object's email and phone are clearly fictional."""
+    assert obj.email.endswith(".local")
+    assert obj.phone.startswith("555-")
+
+
+@pytest.fixture(autouse=True)
+def factory_session(test_session, monkeypatch):
+    """Point every factory at this test's rolled-back session.
+
+    monkeypatch restores each factory's previous session on teardown, so no
+    factory stays bound to this test's closed connection afterwards.
+    """
+    for factory_cls in _FACTORIES:
+        monkeypatch.setattr(factory_cls._meta, "sqlalchemy_session", test_session)
+    return test_session
+
 
 class TestBaseFactory:
     """Test base factory functionality."""
 
-    def test_hipaa_compliance_check(self, test_session):
+    def test_hipaa_compliance_check(self):
         """Test that factories reject real PHI data."""
-        ClientFactory._meta.sqlalchemy_session = test_session
         with pytest.raises(ValueError, match="HIPAA Violation"):
             ClientFactory(ssn="123-45-6789")
 
+    def test_hipaa_rejects_ssn_formatted_values(self):
+        """Test that SSN-shaped values are rejected in any field."""
+        with pytest.raises(ValueError, match="SSN-formatted value in insurance_id"):
+            ClientFactory(insurance_id="123-45-6789")
+
     def test_safe_email_generation(self):
         """Test HIPAA-safe email generation."""
         from factories.base import BaseFactory
@@ -50,10 +88,9 @@ class TestBaseFactory:
         assert phone.startswith("555-")
         assert len(phone) == 8  # 555-XXXX
 
-    def test_tenant_id_generation(self, test_session):
+    def test_tenant_id_generation(self):
         """Test consistent tenant ID generation."""
-        ClientFactory._meta.sqlalchemy_session = test_session
-        client = ClientFactory()
+        client = ClientFactory.build()
         assert client.tenant_id.startswith("tenant_")
         assert len(client.tenant_id) > 7
 
@@ -61,23 +98,20 @@ class TestBaseFactory:
 class TestPracticeProfileFactory:
     """Test practice profile factory."""
 
-    def test_creates_practice_profile(self, test_session):
+    def test_creates_practice_profile(self):
         """Test basic practice profile creation."""
-        PracticeProfileFactory._meta.sqlalchemy_session = test_session
-        profile = PracticeProfileFactory()
+        profile = PracticeProfileFactory.build()
 
         assert isinstance(profile, PracticeProfile)
         assert profile.name
-        assert profile.email.endswith(".local")
-        assert profile.phone.startswith("555-")
+        _assert_hipaa_safe(profile)
         assert profile.npi_number
         assert profile.timezone
         assert profile.tenant_id
 
-    def test_practice_profile_fields(self, test_session):
+    def test_practice_profile_fields(self):
         """Test all practice profile fields are populated."""
-        PracticeProfileFactory._meta.sqlalchemy_session = test_session
-        profile = PracticeProfileFactory()
+        profile = PracticeProfileFactory.build()
 
         # Contact information
         assert profile.email
@@ -102,11 +136,9 @@ class TestPracticeProfileFactory:
 class TestLocationFactory:
     """Test location factory."""
 
-    def test_creates_location(self, test_session):
+    def test_creates_location(self):
         """Test basic location creation."""
-        LocationFactory._meta.sqlalchemy_session = test_session
-        PracticeProfileFactory._meta.sqlalchemy_session = test_session
-        location = LocationFactory()
+        location = LocationFactory.build()
 
         assert isinstance(location, Location)
         assert location.name
@@ -114,21 +146,17 @@ class TestLocationFactory:
         assert location.phone.startswith("555-")
         assert location.tenant_id
 
-    def test_location_practice_relationship(self, test_session):
+    def test_location_practice_relationship(self):
         """Test location-practice relationship."""
-        LocationFactory._meta.sqlalchemy_session = test_session
-        PracticeProfileFactory._meta.sqlalchemy_session = test_session
         practice = PracticeProfileFactory()
         location = LocationFactory(practice_profile=practice)
 
         assert location.practice_profile == practice
         assert location.tenant_id == practice.tenant_id
 
-    def test_location_accessibility_features(self, test_session):
+    def test_location_accessibility_features(self):
         """Test accessibility feature generation."""
-        LocationFactory._meta.sqlalchemy_session = test_session
-        PracticeProfileFactory._meta.sqlalchemy_session = test_session
-        location = LocationFactory()
+        location = LocationFactory.build()
 
         assert isinstance(location.wheelchair_accessible, bool)
         assert isinstance(location.parking_available, bool)
@@ -137,47 +165,26 @@ class TestLocationFactory:
 class TestClientFactory:
     """Test client factory."""
 
-    def test_creates_client(self, test_session):
-        """Test basic client creation."""
-        ClientFactory._meta.sqlalchemy_session = test_session
-        client = ClientFactory()
+    def test_client_factory(self):
+        """Test a generated client end to end."""
+        client = ClientFactory.build()
 
+        # Basic fields
         assert isinstance(client, Client)
         assert client.first_name
         assert client.last_name
-        assert client.email.endswith(".local")
-        assert client.phone.startswith("555-")
+        _assert_hipaa_safe(client)
         assert client.tenant_id
 
-    def test_client_age_validation(self, test_session):
-        """Test client age is appropriate (18+)."""
-        ClientFactory._meta.sqlalchemy_session = test_session
-        client = ClientFactory()
-
+        # Client age is appropriate (18+)
         if client.date_of_birth:
             age = (date.today() - client.date_of_birth).days // 365
             assert age >= 18
 
-    def test_client_hipaa_compliance(self, test_session):
-        """Test client data is HIPAA compliant."""
-        ClientFactory._meta.sqlalchemy_session = test_session
-        client = ClientFactory()
-
-        # Check email domain
-        assert client.email.endswith(".local")
-
-        # Check phone number format
-        assert client.phone.startswith("555-")
-
-        # Check emergency contact
+        # Emergency contact is HIPAA safe too
         if client.emergency_contact_phone:
             assert client.emergency_contact_phone.startswith("555-")
 
-    def test_client_clinical_data(self, test_session):
-        """Test clinical data generation."""
-        ClientFactory._meta.sqlalchemy_session = test_session
-        client = ClientFactory()
-
         # Clinical fields should be populated or None
         assert client.primary_diagnosis is None or isinstance(
             client.primary_diagnosis, str
@@ -197,11 +204,11 @@ class TestClientFactory:
 class TestProviderFactory:
     """Test provider factory."""
 
-    def test_creates_provider(self, test_session):
-        """Test basic provider creation."""
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        provider = ProviderFactory()
+    def test_provider_factory(self):
+        """Test a generated provider end to end."""
+        provider = ProviderFactory.build()
 
+        # Basic fields
         assert isinstance(provider, Provider)
         assert provider.first_name
         assert provider.last_name
@@ -210,30 +217,16 @@ class TestProviderFactory:
         assert provider.npi_number
         assert provider.tenant_id
 
-    def test_provider_professional_info(self, test_session):
-        """Test provider professional information."""
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        provider = ProviderFactory()
-
+        # Professional information
         assert provider.title
-        assert provider.credentials
         assert provider.specialty
         assert provider.license_state
 
-    def test_provider_contact_info(self, test_session):
-        """Test provider contact information is HIPAA safe."""
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        provider = ProviderFactory()
-
-        assert provider.email.endswith(".local")
-        assert provider.phone.startswith("555-")
+        # Contact information is HIPAA safe
+        _assert_hipaa_safe(provider)
         assert provider.office_phone.startswith("555-")
 
-    def test_provider_availability(self, test_session):
-        """Test provider availability settings."""
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        provider = ProviderFactory()
-
+        # Availability settings
         assert isinstance(provider.accepts_new_patients, bool)
         assert isinstance(provider.is_active, bool)
 
@@ -241,12 +234,9 @@ class TestProviderFactory:
 class TestAppointmentFactory:
     """Test appointment factory."""
 
-    def test_creates_appointment(self, test_session):
+    def test_creates_appointment(self):
         """Test basic appointment creation."""
-        AppointmentFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        appointment = AppointmentFactory()
+        appointment = AppointmentFactory.build()
 
         assert isinstance(appointment, Appointment)
         assert appointment.client
@@ -257,12 +247,9 @@ class TestAppointmentFactory:
         assert appointment.scheduled_end
         assert appointment.tenant_id
 
-    def test_appointment_time_logic(self, test_session):
+    def test_appointment_time_logic(self):
         """Test appointment time relationships."""
-        AppointmentFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        appointment = AppointmentFactory()
+        appointment = AppointmentFactory.build()
 
         # Scheduled times should be logical
         assert appointment.scheduled_end > appointment.scheduled_start
@@ -274,11 +261,8 @@ class TestAppointmentFactory:
         if appointment.actual_start and appointment.actual_end:
             assert appointment.actual_end > appointment.actual_start
 
-    def test_appointment_tenant_consistency(self, test_session):
+    def test_appointment_tenant_consistency(self):
         """Test tenant consistency across appointment relationships."""
-        AppointmentFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        ProviderFactory._meta.sqlalchemy_session = test_session
         client = ClientFactory(tenant_id="test_tenant")
         provider = ProviderFactory(tenant_id="test_tenant")
         appointment = AppointmentFactory(
@@ -289,12 +273,9 @@ class TestAppointmentFactory:
         assert appointment.provider.tenant_id == "test_tenant"
         assert appointment.tenant_id == "test_tenant"
 
-    def test_appointment_billing_info(self, test_session):
+    def test_appointment_billing_info(self):
         """Test appointment billing information."""
-        AppointmentFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        appointment = AppointmentFactory()
+        appointment = AppointmentFactory.build()
 
         assert isinstance(appointment.copay_amount, str)
         assert float(appointment.copay_amount) >= 0
@@ -303,13 +284,11 @@ class TestAppointmentFactory:
 class TestNoteFactory:
     """Test note factory."""
 
-    def test_creates_note(self, test_session):
-        """Test basic note creation."""
-        NoteFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        note = NoteFactory()
+    def test_note_factory(self):
+        """Test a generated note end to end."""
+        note = NoteFactory.build()
 
+        # Basic fields
         assert isinstance(note, Note)
         assert note.client
         assert note.provider
@@ -318,63 +297,39 @@ class TestNoteFactory:
         assert note.content
         assert note.tenant_id
 
-    def test_note_soap_structure(self, test_session):
-        """Test note structure for clinical notes."""
-        NoteFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        note = NoteFactory(note_type="progress_note")
-
-        assert note.content
-        assert note.diagnosis_codes
-        assert note.treatment_goals
-        assert note.plan
-
-    def test_note_risk_assessment(self, test_session):
-        """Test clinical assessment fields in notes."""
-        NoteFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        note = NoteFactory()
-
+        # Clinical assessment fields
         assert note.interventions
         assert note.client_response
         assert note.is_signed is not None
 
-    def test_note_mental_status_exam(self, test_session):
-        """Test note billing and review fields."""
-        NoteFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        note = NoteFactory()
-
+        # Billing and review fields
         assert note.billable is not None
         assert note.billing_code
         assert note.is_locked is not None
         assert note.requires_review is not None
 
-    def test_note_content_quality(self, test_session):
-        """Test note content meets quality standards."""
-        NoteFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        note = NoteFactory()
-
+        # Content meets quality standards
         assert len(note.content) >= 50
-        assert note.title
         assert note.treatment_goals
-        assert note.interventions
+
+    def test_note_soap_structure(self):
+        """Test note structure for clinical notes."""
+        note = NoteFactory.build(note_type="progress_note")
+
+        assert note.content
+        assert note.diagnosis_codes
+        assert note.treatment_goals
+        assert note.plan
 
 
 class TestLedgerEntryFactory:
     """Test ledger entry factory."""
 
-    def test_creates_ledger_entry(self, test_session):
-        """Test basic ledger entry creation."""
-        LedgerEntryFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        entry = LedgerEntryFactory()
+    def test_ledger_entry_factory(self):
+        """Test a generated ledger entry end to end."""
+        entry = LedgerEntryFactory.build()
 
+        # Basic fields
         assert isinstance(entry, LedgerEntry)
         assert entry.client
         assert entry.transaction_type
@@ -382,64 +337,14 @@ class TestLedgerEntryFactory:
         assert entry.billing_code
         assert entry.tenant_id
 
-    def test_ledger_financial_logic(self, test_session):
-        """Test financial calculation logic."""
-        LedgerEntryFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        entry = LedgerEntryFactory()
-
         # Amount should be positive
         assert entry.amount > 0
 
         # Transaction type should be valid
-        valid_types = [
-            "charge",
-            "payment",
-            "adjustment",
-            "refund",
-            "write_off",
-            "insurance_payment",
-        ]
-        assert entry.transaction_type in valid_types
-
-    def test_ledger_service_codes(self, test_session):
-        """Test service code generation."""
-        LedgerEntryFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        entry = LedgerEntryFactory()
+        assert entry.transaction_type in VALID_TRANSACTION_TYPES
 
         # Should have valid CPT codes
-        valid_codes = [
-            "90834",
-            "90837",
-            "90791",
-            "90834+90836",
-            "90847",
-            "90853",
-            "99213",
-            "99214",
-            "96116",
-            "96118",
-        ]
-        assert entry.billing_code in valid_codes
-
-    def test_ledger_payment_processing(self, test_session):
-        """Test payment processing fields."""
-        LedgerEntryFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        entry = LedgerEntryFactory(transaction_type="payment")
-
-        assert entry.payment_method
-        assert entry.reference_number
-
-        if entry.payment_method == "check":
-            assert entry.check_number
-
-    def test_ledger_date_logic(self, test_session):
-        """Test date field logic."""
-        LedgerEntryFactory._meta.sqlalchemy_session = test_session
-        ClientFactory._meta.sqlalchemy_session = test_session
-        entry = LedgerEntryFactory()
+        assert entry.billing_code in VALID_BILLING_CODES
 
         # Service date should be in the past or today
         assert entry.service_date <= date.today()
@@ -448,27 +353,29 @@ class TestLedgerEntryFactory:
         if entry.reconciliation_date:
             assert entry.reconciliation_date >= entry.service_date
 
+    def test_ledger_payment_processing(self):
+        """Test payment processing fields."""
+        entry = LedgerEntryFactory.build(transaction_type="payment")
+
+        assert entry.payment_method
+        assert entry.reference_number
+
+        if entry.payment_method == "check":
+            assert entry.check_number
+
 
 class TestFactoryIntegration:
     """Test factory integration and relationships."""
 
-    def test_multi_tenant_isolation(self, test_session):
+    def test_multi_tenant_isolation(self):
         """Test multi-tenant data isolation."""
-        ClientFactory._meta.sqlalchemy_session = test_session
-        tenant1_client = ClientFactory(tenant_id="tenant_001")
-        tenant2_client = ClientFactory(tenant_id="tenant_002")
+        tenant1_client = ClientFactory.build(tenant_id="tenant_001")
+        tenant2_client = ClientFactory.build(tenant_id="tenant_002")
 
         assert tenant1_client.tenant_id != tenant2_client.tenant_id
 
-    def test_related_object_creation(self, test_session):
+    def test_related_object_creation(self):
         """Test creation of related objects."""
-        # Set up all factory sessions
-        ClientFactory._meta.sqlalchemy_session = test_session
-        ProviderFactory._meta.sqlalchemy_session = test_session
-        AppointmentFactory._meta.sqlalchemy_session = test_session
-        NoteFactory._meta.sqlalchemy_session = test_session
-        LedgerEntryFactory._meta.sqlalchemy_session = test_session
-
         # Create a complete appointment with related objects
         client = ClientFactory()
         provider = ProviderFactory(tenant_id=client.tenant_id)
@@ -497,15 +404,11 @@ class TestFactoryIntegration:
             ]
         )
 
-    def test_bulk_data_generation(self, test_session):
+    def test_bulk_data_generation(self, factory_session):
         """Test bulk data generation performance."""
-        # Set up factory sessions
-        ClientFactory._meta.sqlalchemy_session = test_session
-        ProviderFactory._meta.sqlalchemy_session = test_session
-
         # Generate multiple objects efficiently
-        clients = ClientFactory.create_batch(10)
-        providers = ProviderFactory.create_batch(5)
+        clients = ClientFactory.create_batch_bulk(10)
+        providers = ProviderFactory.create_batch_bulk(5)
 
         assert len(clients) == 10
         assert len(providers) == 5
@@ -518,3 +421,21 @@ class TestFactoryIntegration:
         for provider in providers:
             assert isinstance(provider, Provider)
             assert provider.tenant_id
+
+        # Rows are batched into executemany INSERTs, not per-object flushes
+        assert factory_session.query(Client).count() == 10
+        assert factory_session.query(Provider).count() == 5
+
+    def test_bulk_create_rejects_phi(self):
+        """Test bulk creation applies the same HIPAA check."""
+        with pytest.raises(ValueError, match="HIPAA Violation"):
+            ClientFactory.create_batch_bulk(2, ssn="123-45-6789")
+
+    def test_bulk_create_checks_generated_values(self, factory_session):
+        """Test bulk creation checks generated values, not just overrides."""
+        ssn_like = factory.LazyFunction(lambda: "123-45-6789")
+
+        with pytest.raises(ValueError, match="SSN-formatted value in insurance_id"):
+            ClientFactory.create_batch_bulk(2, insurance_id=ssn_like)
+
+        assert factory_session.query(Client).count() == 0
@@ -1,109 +1,128 @@
 """Tests for Feature Flags utility."""
 
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 
 from utils.feature_flags import FeatureFlags, get_feature_flags
 
+# Settings values the shared module fixtures are built from
+_SETTINGS_VALUES = MappingProxyType(
+    {
+        "enable_mock_edi": True,
+        "enable_mock_payments": False,
+        "enable_mock_video": True,
+        "edi_service_url": "https://edi.example.com",
+        "stripe_api_key": "sk_test_123",
+        "stripe_webhook_secret": "whsec_123",
+        "video_service_url": "https://video.example.com",
+        "video_api_key": "video_key_123",
+    }
+)
 
-class TestFeatureFlags:
-    """Test cases for FeatureFlags class."""
-
-    @pytest.fixture
-    def mock_settings(self):
-        """Create mock settings."""
-        settings = MagicMock()
-        settings.enable_mock_edi = True
-        settings.enable_mock_payments = False
-        settings.enable_mock_video = True
-        settings.edi_service_url = "https://edi.example.com"
-        settings.stripe_api_key = "sk_test_123"
-        settings.stripe_webhook_secret = "whsec_123"
-        settings.video_service_url = "https://video.example.com"
-        settings.video_api_key = "video_key_123"
-        return settings
-
-    @pytest.fixture
-    def feature_flags(self, mock_settings):
-        """Create FeatureFlags instance with mock settings."""
-        with patch("utils.feature_flags.get_settings", return_value=mock_settings):
-            return FeatureFlags()
-
-    def test_initialization(self, feature_flags, mock_settings):
-        """Test FeatureFlags initialization."""
-        assert feature_flags.settings == mock_settings
-
-    def test_is_mock_edi_enabled_true(self, feature_flags):
-        """Test EDI mock flag when enabled."""
-        assert feature_flags.is_mock_edi_enabled() is True
-
-    def test_is_mock_edi_enabled_false(self, mock_settings):
-        """Test EDI mock flag when disabled."""
-        mock_settings.enable_mock_edi = False
-        with patch("utils.feature_flags.get_settings", return_value=mock_settings):
-            flags = FeatureFlags()
-            assert flags.is_mock_edi_enabled() is False
-
-    def test_is_mock_payments_enabled_false(self, feature_flags):
-        """Test payments mock flag when disabled."""
-        assert feature_flags.is_mock_payments_enabled() is False
-
-    def test_is_mock_payments_enabled_true(self, mock_settings):
-        """Test payments mock flag when enabled."""
-        mock_settings.enable_mock_payments = True
-        with patch("utils.feature_flags.get_settings", return_value=mock_settings):
-            flags = FeatureFlags()
-            assert flags.is_mock_payments_enabled() is True
-
-    def test_is_mock_video_enabled_true(self, feature_flags):
-        """Test video mock flag when enabled."""
-        assert feature_flags.is_mock_video_enabled() is True
-
-    def test_is_mock_video_enabled_false(self, mock_settings):
-        """Test video mock flag when disabled."""
-        mock_settings.enable_mock_video = False
-        with patch("utils.feature_flags.get_settings", return_value=mock_settings):
-            flags = FeatureFlags()
-            assert flags.is_mock_video_enabled() is False
-
-    def test_get_service_config_edi(self, feature_flags):
-        """Test EDI service configuration."""
-        config = feature_flags.get_service_config("edi")
 
-        expected = {
-            "enabled": True,
-            "service_url": "https://edi.example.com",
-            "mock_endpoint": "/mock/edi",
-        }
+def _make_settings(**overrides):
+    """Create stand-in settings, optionally overriding individual values."""
+    return SimpleNamespace(**{**_SETTINGS_VALUES, **overrides})
 
-        assert config == expected
 
-    def test_get_service_config_payments(self, feature_flags):
-        """Test payments service configuration."""
-        config = feature_flags.get_service_config("payments")
+@pytest.fixture(scope="module")
+def mock_settings():
+    """Shared mock settings; tests must not mutate them."""
+    return _make_settings()
 
-        expected = {
-            "enabled": False,
-            "api_key": "sk_test_123",
-            "webhook_secret": "whsec_123",
-            "mock_endpoint": "/mock/payments",
-        }
 
-        assert config == expected
+@pytest.fixture(scope="module")
+def feature_flags(mock_settings):
+    """Shared FeatureFlags instance built from mock_settings."""
+    return FeatureFlags(settings=mock_settings)
 
-    def test_get_service_config_video(self, feature_flags):
-        """Test video service configuration."""
-        config = feature_flags.get_service_config("video")
 
-        expected = {
-            "enabled": True,
-            "service_url": "https://video.example.com",
-            "api_key": "video_key_123",
-            "mock_endpoint": "/mock/video",
-        }
+class TestFeatureFlags:
+    """Test cases for FeatureFlags class."""
 
-        assert config == expected
+    def test_initialization(self, feature_flags, mock_settings):
+        """Test FeatureFlags initialization."""
+        assert feature_flags.settings is mock_settings
+
+    def test_initialization_defaults_to_current_settings(self, monkeypatch):
+        """Test FeatureFlags falls back to get_settings() when none are given."""
+        settings = _make_settings()
+        monkeypatch.setattr("utils.feature_flags.get_settings", lambda: settings)
+
+        assert FeatureFlags().settings is settings
+
+    @pytest.mark.parametrize(
+        "method,overrides,expected",
+        [
+            pytest.param("is_mock_edi_enabled", {}, True, id="edi_true"),
+            pytest.param(
+                "is_mock_edi_enabled",
+                {"enable_mock_edi": False},
+                False,
+                id="edi_false",
+            ),
+            pytest.param("is_mock_payments_enabled", {}, False, id="payments_false"),
+            pytest.param(
+                "is_mock_payments_enabled",
+                {"enable_mock_payments": True},
+                True,
+                id="payments_true",
+            ),
+            pytest.param("is_mock_video_enabled", {}, True, id="video_true"),
+            pytest.param(
+                "is_mock_video_enabled",
+                {"enable_mock_video": False},
+                False,
+                id="video_false",
+            ),
+        ],
+    )
+    def test_is_mock_enabled(self, feature_flags, method, overrides, expected):
+        """Test each mock flag reflects its setting."""
+        # Flipped flags get their own instance; the shared one stays untouched
+        flags = (
+            FeatureFlags(settings=_make_settings(**overrides))
+            if overrides
+            else feature_flags
+        )
+
+        assert getattr(flags, method)() is expected
+
+    @pytest.mark.parametrize(
+        "service_type,expected",
+        [
+            (
+                "edi",
+                {
+                    "enabled": True,
+                    "service_url": "https://edi.example.com",
+                    "mock_endpoint": "/mock/edi",
+                },
+            ),
+            (
+                "payments",
+                {
+                    "enabled": False,
+                    "api_key": "sk_test_123",
+                    "webhook_secret": "whsec_123",
+                    "mock_endpoint": "/mock/payments",
+                },
+            ),
+            (
+                "video",
+                {
+                    "enabled": True,
+                    "service_url": "https://video.example.com",
+                    "api_key": "video_key_123",
+                    "mock_endpoint": "/mock/video",
+                },
+            ),
+        ],
+    )
+    def test_get_service_config(self, feature_flags, service_type, expected):
+        """Test per-service configuration."""
+        assert feature_flags.get_service_config(service_type) == expected
 
     def test_get_service_config_unknown_service(self, feature_flags):
         """Test service configuration with unknown service type."""
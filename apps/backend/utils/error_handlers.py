@@ -1,6 +1,7 @@
 """Standardized error handling utilities for API endpoints."""
 
 import logging
+from functools import singledispatch
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
@@ -204,29 +205,41 @@ class DatabaseError(APIError):
         )
 
 
+@singledispatch
 def handle_database_error(
     e: Exception, correlation_id: str, operation: str = "database operation"
 ) -> APIError:
-    """Convert database exceptions to standardized API errors."""
+    """Convert database exceptions to standardized API errors.
+
+    Dispatches on the exception type; this fallback covers non-database errors.
+    """
+    return APIError(
+        message=f"Unexpected error during {operation}",
+        details={"operation": operation, "error": str(e)},
+        correlation_id=correlation_id,
+    )
 
-    if isinstance(e, IntegrityError):
-        return ValidationError(
-            message="Data integrity constraint violation",
-            details={"operation": operation, "constraint_error": str(e.orig)},
-            correlation_id=correlation_id,
-        )
-    elif isinstance(e, SQLAlchemyError):
-        return DatabaseError(
-            message=f"Database {operation} failed",
-            details={"operation": operation, "error": str(e)},
-            correlation_id=correlation_id,
-        )
-    else:
-        return APIError(
-            message=f"Unexpected error during {operation}",
-            details={"operation": operation, "error": str(e)},
-            correlation_id=correlation_id,
-        )
+
+@handle_database_error.register(IntegrityError)
+def _handle_integrity_error(
+    e: IntegrityError, correlation_id: str, operation: str = "database operation"
+) -> APIError:
+    return ValidationError(
+        message="Data integrity constraint violation",
+        details={"operation": operation, "constraint_error": str(e.orig)},
+        correlation_id=correlation_id,
+    )
+
+
+@handle_database_error.register(SQLAlchemyError)
+def _handle_sqlalchemy_error(
+    e: SQLAlchemyError, correlation_id: str, operation: str = "database operation"
+) -> APIError:
+    return DatabaseError(
+        message=f"Database {operation} failed",
+        details={"operation": operation, "error": str(e)},
+        correlation_id=correlation_id,
+    )
 
 
 def log_and_raise_error(
@@ -2,15 +2,15 @@
 
 from typing import Any, Dict, Optional
 
-from core.config import get_settings
+from core.config import Settings, get_settings
 
 
 class FeatureFlags:
     """Centralized feature flag management."""
 
-    def __init__(self):
-        """Initialize with current settings."""
-        self.settings = get_settings()
+    def __init__(self, settings: Optional[Settings] = None):
+        """Initialize with the given settings, or the current ones."""
+        self.settings = settings or get_settings()
 
     def is_mock_edi_enabled(self) -> bool:
         """Check if mock EDI service is enabled."""